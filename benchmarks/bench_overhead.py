@@ -0,0 +1,68 @@
+""" Per-call overhead of the decorator wrapper, with validation switched on, off for a scope and off for the process.
+
+Run from the repository root: python -m benchmarks.bench_overhead
+
+The plain wrapper is the least any decorator costs: a functools.wraps closure passing *args and **kwargs through.
+The wrapper of pd_typeguard is measured with a validator that does nothing, and compared to it; the exit status is
+1 if it costs more than --max-overhead nanoseconds on top.
+"""
+import argparse
+import functools
+import sys
+import timeit
+
+from pd_typeguard import NotEmpty, config
+from pd_typeguard.decorators import ReturnValueDecorator
+
+
+def bare(value):
+    return value
+
+
+def plain_wrapper(fcn):
+    @functools.wraps(fcn)
+    def inner(*args, **kwargs):
+        return fcn(*args, **kwargs)
+    return inner
+
+
+class NoOp(ReturnValueDecorator):
+
+    def validate(self, value):
+        return value
+
+
+def bench(fcn, number=1000000, repeat=5):
+    """ Best time per call in nanoseconds. """
+    value = [1]
+    return min(timeit.repeat(lambda: fcn(value), number=number, repeat=repeat)) / number * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-overhead', type=float, default=300.,
+                        help='nanoseconds the wrapper may cost on top of the plain wrapper')
+    args = parser.parse_args(argv)
+    results = [('undecorated', bench(bare)), ('plain wrapper', bench(plain_wrapper(bare)))]
+    wrapper = NoOp()(bare)
+    results.append(('wrapper (no-op validator)', bench(wrapper)))
+    decorated = NotEmpty()(bare)
+    results.append(('validated (NotEmpty)', bench(decorated)))
+    with config.disabled():
+        results.append(('disabled() scope', bench(decorated)))
+    config.set_enabled(False)
+    try:
+        results.append(('disabled for the process', bench(NotEmpty()(bare))))
+    finally:
+        config.set_enabled(True)
+    baseline = results[0][1]
+    for name, ns in results:
+        print('%-28s %8.1f ns/call  %+8.1f ns' % (name, ns, ns - baseline))
+    overhead = results[2][1] - results[1][1]
+    print('wrapper overhead on top of the plain wrapper: %.1f ns, wrapper.__name__ == %r' % (
+        overhead, wrapper.__name__))
+    return int(overhead > args.max_overhead or wrapper.__wrapped__ is not bare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
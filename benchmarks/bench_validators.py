@@ -0,0 +1,243 @@
+""" Wall time and peak memory of every validator across frame shapes, dtypes and null densities.
+
+The classes follow the asv conventions (params, setup, time_* and peakmem_* methods), so the suite runs under asv.
+Without asv, run it from the repository root:
+
+    python -m benchmarks.bench_validators --max-rows 1000000 --output results.json
+    python -m benchmarks.bench_validators --compare results.json
+
+Peak memory is measured with tracemalloc here, which tracks numpy and pandas buffers. --compare reports
+benchmarks that got slower or use more memory than in a previous output by more than --threshold.
+"""
+import argparse
+import itertools
+import json
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pd_typeguard import (ReturnValueError, NotEmpty, HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique,
+                          ColumnSingleValue)
+
+DTYPES = ['int', 'float', 'object', 'category', 'datetime_tz', 'Int64', 'boolean']
+
+
+def make_column(dtype, n_rows, null_density, kind, seed=0):
+    """ Column of a benchmark frame.
+
+    :param str kind: 'key' for distinct values, 'const' for a single value, 'data' for random values.
+    """
+    rng = np.random.default_rng(seed)
+    if kind == 'key':
+        values = np.arange(n_rows)
+    elif kind == 'const':
+        values = np.zeros(n_rows, dtype=np.int64)
+    else:
+        values = rng.integers(0, 1000, n_rows)
+    if dtype == 'int':
+        column = pd.Series(values)
+    elif dtype == 'float':
+        column = pd.Series(values.astype(np.float64))
+    elif dtype == 'object':
+        column = pd.Series(values.astype(str).astype(object))
+    elif dtype == 'category':
+        column = pd.Series(pd.Categorical(values))
+    elif dtype == 'datetime_tz':
+        column = pd.Series(pd.to_datetime(values, unit='s', utc=True))
+    elif dtype == 'Int64':
+        column = pd.Series(pd.array(values, dtype='Int64'))
+    elif dtype == 'boolean':
+        column = pd.Series(pd.array(values % 2 == 0 if kind != 'key' else values >= 0, dtype='boolean'))
+    else:
+        raise ValueError(dtype)
+    if null_density and kind != 'key':
+        column[rng.random(n_rows) < null_density] = None
+    return column
+
+
+class Rows(object):
+    """ Validators on a frame with a data, a key and a constant column, by row count, dtype and null density. """
+
+    params = ([10 ** 2, 10 ** 4, 10 ** 6, 10 ** 8], DTYPES, [0., 0.1])
+    param_names = ['n_rows', 'dtype', 'null_density']
+    timeout = 600
+
+    def setup(self, n_rows, dtype, null_density):
+        if null_density and dtype == 'int':
+            raise NotImplementedError('numpy integer columns cannot hold nulls')
+        self.df = pd.DataFrame({kind: make_column(dtype, n_rows, null_density, kind)
+                                for kind in ('data', 'key', 'const')})
+        self.validators = {
+            'not_empty': NotEmpty(),
+            'has_column': HasColumn(['data', 'key', 'const']),
+            'has_dtype': ColumnHasDtype({kind: self.df[kind].dtype for kind in self.df.columns}),
+            'not_null': ColumnNotNull({'key': 'all', 'data': 'any'}),
+            'unique': ColumnUnique(['key']),
+            'single_value': ColumnSingleValue(['const']),
+        }
+
+    def validate(self, name):
+        """ Failing validations are measured too, like unique on a boolean key. """
+        try:
+            self.validators[name].validate(self.df)
+        except ReturnValueError:
+            pass
+
+    def time_not_empty(self, *params):
+        self.validate('not_empty')
+
+    def time_has_column(self, *params):
+        self.validate('has_column')
+
+    def time_has_dtype(self, *params):
+        self.validate('has_dtype')
+
+    def time_not_null(self, *params):
+        self.validate('not_null')
+
+    def time_unique(self, *params):
+        self.validate('unique')
+
+    def time_single_value(self, *params):
+        self.validate('single_value')
+
+    def peakmem_not_null(self, *params):
+        self.validate('not_null')
+
+    def peakmem_unique(self, *params):
+        self.validate('unique')
+
+    def peakmem_single_value(self, *params):
+        self.validate('single_value')
+
+
+class Columns(object):
+    """ Validators constraining every column of a wide frame, by column count, dtype and null density. Not null
+    constraints are validated on data columns with nulls, the others on key columns. """
+
+    params = ([1, 100, 10000], DTYPES, [0., 0.1])
+    param_names = ['n_columns', 'dtype', 'null_density']
+    n_rows = 1000
+    timeout = 600
+
+    def setup(self, n_columns, dtype, null_density):
+        if null_density and dtype == 'int':
+            raise NotImplementedError('numpy integer columns cannot hold nulls')
+        key = make_column(dtype, self.n_rows, null_density, 'key')
+        data = make_column(dtype, self.n_rows, null_density, 'data')
+        self.df = pd.DataFrame({'c%i' % i: key for i in range(n_columns)})
+        self.data = pd.DataFrame({'c%i' % i: data for i in range(n_columns)})
+        columns = list(self.df.columns)
+        self.validators = {
+            'has_column': (HasColumn(columns), self.df),
+            'has_dtype': (ColumnHasDtype({column: self.df[column].dtype for column in columns}), self.df),
+            'not_null': (ColumnNotNull({column: 'any' for column in columns}), self.data),
+            'unique': (ColumnUnique(columns), self.df),
+        }
+
+    def validate(self, name):
+        """ Failing validations are measured too, like unique on boolean columns. """
+        validator, df = self.validators[name]
+        try:
+            validator.validate(df)
+        except ReturnValueError:
+            pass
+
+    def time_has_column(self, *params):
+        self.validate('has_column')
+
+    def time_has_dtype(self, *params):
+        self.validate('has_dtype')
+
+    def time_not_null(self, *params):
+        self.validate('not_null')
+
+    def time_unique(self, *params):
+        self.validate('unique')
+
+    def peakmem_not_null(self, *params):
+        self.validate('not_null')
+
+
+BENCHMARKS = [Rows, Columns]
+
+
+def run_benchmark(name, method, repeat=3, min_seconds=0.02):
+    """ Best wall time in seconds, or tracemalloc peak in bytes for peakmem benchmarks. """
+    if name.startswith('peakmem_'):
+        tracemalloc.start()
+        try:
+            method()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    timer = timeit.Timer(method)
+    number = max(1, int(min_seconds / max(timer.timeit(1), 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(max_rows, max_columns, pattern=None):
+    results = {}
+    for benchmark in BENCHMARKS:
+        for params in itertools.product(*benchmark.params):
+            size = dict(zip(benchmark.param_names, params))
+            if size.get('n_rows', 0) > max_rows or size.get('n_columns', 0) > max_columns:
+                continue
+            instance = benchmark()
+            try:
+                instance.setup(*params)
+            except NotImplementedError:
+                continue
+            for name in sorted(dir(instance)):
+                if not name.startswith(('time_', 'peakmem_')):
+                    continue
+                key = '%s.%s(%s)' % (benchmark.__name__, name, ', '.join(str(param) for param in params))
+                if pattern and pattern not in key:
+                    continue
+                method = getattr(instance, name)
+                results[key] = run_benchmark(name, lambda: method(*params))
+                print('%-72s %s' % (key, format_result(name, results[key])))
+                sys.stdout.flush()
+    return results
+
+
+def format_result(name, result):
+    if 'peakmem_' in name:
+        return '%10.2f MiB' % (result / 2. ** 20)
+    return '%10.3f ms' % (result * 1e3)
+
+
+def compare(results, baseline, threshold):
+    regressions = [(key, baseline[key], result) for key, result in results.items()
+                   if key in baseline and baseline[key] > 0 and result > baseline[key] * (1 + threshold)]
+    for key, before, after in regressions:
+        print('REGRESSION %-61s %s -> %s' % (key, format_result(key, before).strip(),
+                                             format_result(key, after).strip()))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-rows', type=int, default=10 ** 6)
+    parser.add_argument('--max-columns', type=int, default=10 ** 4)
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON file of a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown reported as regression')
+    args = parser.parse_args(argv)
+    results = run(args.max_rows, args.max_columns, args.filter)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=1, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as baseline:
+            if compare(results, json.load(baseline), args.threshold):
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,10 @@
 from .exceptions import (ReturnValueError, DFEmptyError, MissingColumnError, ColumnNullError,
-                         WrongDtypeError, ColumnNotUniqueError, ColumnNotSingleValueError)
+                         WrongDtypeError, ColumnNotUniqueError, ColumnNotSingleValueError, ValidationReportError)
 from .decorators import (NotEmpty, HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue)
+from .schema import Schema
+from .sampling import Sample, SampleGuarantee
+from .cache import ValidationCache
+from .report import ValidationReport
+from .incremental import IncrementalValidator
+from .readers import read_csv
+from .deferred import DeferredPool
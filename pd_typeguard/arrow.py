@@ -0,0 +1,87 @@
+""" Kernels for Arrow data: pyarrow Tables and pandas columns with an ArrowDtype.
+
+Tables are wrapped into DataFrames of Arrow-backed columns without copying, so that all validators accept them.
+Arrow-backed columns are validated with pyarrow.compute instead of being converted to NumPy: null counts are read
+from the array metadata, uniqueness and single values are computed by Arrow kernels.
+"""
+import pandas as pd
+from pandas.api.types import pandas_dtype
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = pc = None
+
+
+def is_table(value):
+    return pa is not None and isinstance(value, (pa.Table, pa.RecordBatch))
+
+
+def as_frame(value):
+    """ DataFrame of Arrow-backed columns sharing the buffers of a pyarrow Table or RecordBatch, any other value
+    unchanged. """
+    if not is_table(value):
+        return value
+    return pd.DataFrame({name: pd.arrays.ArrowExtensionArray(column)
+                         for name, column in zip(value.column_names, value.columns)}, copy=False)
+
+
+def is_arrow(series):
+    return isinstance(series.dtype, pd.ArrowDtype)
+
+
+def _array(series):
+    """ The ChunkedArray behind an Arrow-backed column, dictionaries decoded. """
+    array = series.array.__arrow_array__()
+    if pa.types.is_dictionary(array.type):
+        array = pa.chunked_array([chunk.dictionary_decode() for chunk in array.chunks], array.type.value_type)
+    return array
+
+
+def null_count(series):
+    """ Number of nulls, from the metadata of the chunks. """
+    return series.array.__arrow_array__().null_count
+
+
+def has_duplicates(data):
+    """ True if an Arrow-backed column, or a DataFrame of them, holds a value or a row twice. Nulls are equal. """
+    if isinstance(data, pd.Series):
+        return len(pc.unique(_array(data))) < len(data)
+    table = pa.table({str(i): _array(data.iloc[:, i]) for i in range(len(data.columns))})
+    return table.group_by(table.column_names).aggregate([]).num_rows < len(data)
+
+
+def scan_single_value(series, first, no_value):
+    """ Arrow version of decorators._scan_single_value, returning Python values.
+
+    :param no_value: marker for a missing value.
+    :return: pair of values, or None if Arrow cannot compare values of this type.
+    """
+    array = _array(series)
+    if array.null_count == len(array):
+        return first, no_value
+    if first is no_value:
+        first = array[0 if not array.null_count else pc.index(pc.is_valid(array), True).as_py()].as_py()
+    try:
+        differs = pc.not_equal(array, pa.scalar(first, array.type))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return None
+    position = pc.index(differs, True).as_py()
+    return first, no_value if position < 0 else array[position].as_py()
+
+
+def normalize_dtype(dtype):
+    """ Parses an expected dtype once into the np.dtype or ExtensionDtype it compares equal to, pyarrow DataTypes
+    into ArrowDtypes. Specs that match several dtypes, like 'category', and specs pandas does not parse are kept. """
+    if pa is not None and isinstance(dtype, pa.DataType):
+        return pd.ArrowDtype(dtype)
+    try:
+        normalized = pandas_dtype(dtype)
+    except (TypeError, ValueError):
+        return dtype
+    if isinstance(normalized, pd.CategoricalDtype) and normalized.categories is None \
+            or isinstance(normalized, pd.IntervalDtype) and normalized.subtype is None \
+            or getattr(normalized, 'kind', None) in ('U', 'S', 'V'):
+        return dtype
+    return normalized
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from threading import Lock
+import weakref
+
+
+class ValidationCache(object):
+
+    def __init__(self, maxsize=256):
+        """ Remembers which objects passed which validators, keyed by object identity.
+
+        An entry holds a weak reference to the validated object, so it never keeps a frame alive and is dropped
+        when the frame is garbage collected. A fingerprint of the shape and of the identity of the columns, the
+        index and the column arrays is stored with it, so that an entry goes stale when rows or columns are added,
+        removed or reassigned, like in df['a'] = 1. Values written in place into existing arrays, like in
+        df.loc[0, 'a'] = 1, are not detected: only use the cache for frames that are not modified that way after
+        they have been returned.
+
+        :param int maxsize: number of entries, the least recently used entry is evicted first.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive, got %r' % maxsize)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def fingerprint(value):
+        """ Cheap staleness check: type, shape and identity of the columns, the index and the arrays of a
+        DataFrame. """
+        manager = getattr(value, '_mgr', None)
+        arrays = tuple(id(array) for array in manager.arrays) if manager is not None else ()
+        return type(value), getattr(value, 'shape', None), id(getattr(value, 'columns', None)), \
+            id(getattr(value, 'index', None)), arrays
+
+    def __contains__(self, item):
+        value, signature = item
+        key = (id(value), signature)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            ref, fingerprint = entry
+            if ref() is not value or fingerprint != self.fingerprint(value):
+                del self._entries[key]
+                return False
+            self._entries.move_to_end(key)
+            return True
+
+    def add(self, value, signature):
+        """ Records that value passed the validator with the given signature. Objects that do not support weak
+        references are not cached. """
+        key = (id(value), signature)
+        try:
+            ref = weakref.ref(value, lambda _, key=key: self._discard(key))
+        except TypeError:
+            return
+        with self._lock:
+            self._entries[key] = (ref, self.fingerprint(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _discard(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._entries[key]
+
+    def __getstate__(self):
+        """ Entries refer to objects of this process, a pickled cache starts empty. """
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.maxsize = state['maxsize']
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+default_cache = ValidationCache()
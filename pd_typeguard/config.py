@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import os
+
+ENV_DISABLE = 'PD_TYPEGUARD_DISABLE'
+
+_enabled = os.environ.get(ENV_DISABLE, '').strip().lower() not in ('1', 'true', 'yes', 'on')
+_disabled_scope = ContextVar('pd_typeguard_disabled', default=False)
+
+
+def set_enabled(enabled):
+    """ Switches validation on or off for the whole process. Read from the environment variable
+    PD_TYPEGUARD_DISABLE at import. Functions decorated while validation is switched off are not wrapped at all and
+    stay unvalidated. """
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    """ Whether decorated functions validate their return values in the current thread and context. """
+    return _enabled and not _disabled_scope.get()
+
+
+@contextmanager
+def disabled():
+    """ Context manager that switches validation off for the current thread or asyncio task only. """
+    token = _disabled_scope.set(True)
+    try:
+        yield
+    finally:
+        _disabled_scope.reset(token)
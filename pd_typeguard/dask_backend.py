@@ -0,0 +1,143 @@
+""" Validation of dask DataFrames as part of their task graph.
+
+Columns and dtypes are validated on the metadata of the frame. The content is validated per partition, like a
+chunk of a stream, in the task that returns the partition: violations within a partition are raised when it is
+computed.
+
+Violations between partitions are found by a separate reduction over the states of the partitions (row count, 'any'
+columns with only nulls, first values of single value columns, row hashes of unique columns and keys). The last
+partition of the returned frame depends on its result, so that computing the frame raises them; the other
+partitions do not wait for it. With gate=False no partition depends on it, and the violations between partitions
+are only raised by the dask Scalar in the validation attribute of the returned frame. Compute it together with the
+frame, so that the partitions are computed once for both:
+
+    validated = dask_backend.validate(validator, ddf, gate=False)
+    df, _ = dask.compute(validated, validated.validation)
+
+The states are combined in trees with the _merge_states of the validator. The row hashes are split into hash
+partitions, each combined in a tree of its own: a task holds the hashes of one hash partition, 8 bytes per row of
+the frame for each unique column or key divided by the number of hash partitions, see _n_buckets. A hash collision
+between partitions is reported as a duplicate. Frames derived from the returned frame do not carry the validation
+attribute. The sample option does not apply.
+"""
+from copy import copy
+from functools import reduce
+import numpy as np
+import pandas as pd
+
+try:
+    import dask.dataframe as dd
+    from dask import delayed
+except ImportError:  # pragma: no cover
+    dd = delayed = None
+
+SPLIT_EVERY = 8  # number of states combined per task
+MAX_BUCKETS = 64  # upper bound of the number of hash partitions of the row hashes
+_HASH_STATES = ('hashes', 'key_hashes')  # state entries with the row hashes of unique columns and keys
+
+
+def is_dask(value):
+    return dd is not None and isinstance(value, dd.DataFrame)
+
+
+def validate(validator, value, errors=None, gate=True):
+    """ Validates the metadata of a dask DataFrame, and returns a DataFrame that validates its content when it is
+    computed, see validate_partitions.
+
+    :param HasColumn validator: the constraints.
+    :param list errors: collect metadata violations instead of raising them. Content violations are raised on
+        computation in any case.
+    :param bool gate: see validate_partitions.
+    """
+    meta = value._meta
+    if not validator._validate_has_columns(meta, errors):
+        return value
+    validator._validate_details(meta, True, errors=errors)
+    return validate_partitions(validator, value, gate)
+
+
+def validate_partitions(validator, value, gate=True):
+    """ Returns a DataFrame whose partitions are validated on their own when they are computed, with the validation
+    between partitions as a dask Scalar in its validation attribute, that computes to True or raises the violation.
+
+    :param ReturnValueDecorator validator: validates the partitions as chunks of a stream.
+    :param bool gate: the last partition depends on the validation between partitions. If False, violations between
+        partitions are only raised by the validation attribute.
+    """
+    validator = _task_validator(validator)
+    n_buckets = _n_buckets(value.npartitions) if _has_hashes(validator._new_state()) else 0
+    parts = [delayed(_validate_partition, pure=False, nout=n_buckets + 2)(validator, partition, n_buckets)
+             for partition in value.to_delayed(optimize_graph=False)]
+    summary = _combine(validator, [part[1] for part in parts])
+    buckets = [_combine(validator, [part[2 + i] for part in parts]) for i in range(n_buckets)]
+    passed = delayed(_finish, pure=False)(validator, summary, *buckets)
+    partitions = [part[0] for part in parts]
+    if gate:
+        partitions[-1] = delayed(_after, pure=False)(partitions[-1], passed)
+    validated = dd.from_delayed(partitions, meta=value._meta, divisions=value.divisions, verify_meta=False)
+    validation = dd.from_delayed([passed], meta=pd.Series(dtype=bool), verify_meta=False).all()
+    # set on the object, a column named validation would be replaced otherwise
+    object.__setattr__(validated, 'validation', validation)
+    return validated
+
+
+def _task_validator(validator):
+    """ Copy of the validator for the task graph, without the options that only apply to the validating call (cache,
+    executor, stats, deferred pool), so that it can be sent to the workers of any scheduler. """
+    validator = copy(validator)
+    validator.cache = validator.executor = validator.stats = validator.deferred = None
+    return validator
+
+
+def _n_buckets(npartitions):
+    """ Number of hash partitions, the square root of the number of partitions: a hash partition holds about as many
+    hashes as that many partitions have rows, and the graph grows by that factor. """
+    return min(int(np.ceil(np.sqrt(npartitions))), MAX_BUCKETS)
+
+
+def _has_hashes(state):
+    return any(state.get(name) for name in _HASH_STATES)
+
+
+def _validate_partition(validator, partition, n_buckets):
+    """ Validates a partition, and returns it with its state split into a summary without row hashes and n_buckets
+    states with the row hashes of one hash partition each. """
+    state = validator._new_state()
+    validator._validate_chunk(partition, state)
+    buckets = [validator._new_state() for _ in range(n_buckets)]
+    for name in _HASH_STATES:
+        for item, runs in state.get(name, {}).items():
+            if not runs:
+                continue
+            hashes = np.concatenate(runs)
+            bucket_of = hashes % np.uint64(n_buckets)
+            order = np.lexsort((hashes, bucket_of))
+            splits = np.searchsorted(bucket_of[order], np.arange(1, n_buckets, dtype=np.uint64))
+            for bucket, bucket_hashes in zip(buckets, np.split(hashes[order], splits)):
+                bucket[name][item] = (bucket_hashes,)
+            state[name][item] = ()
+    return (partition, state) + tuple(buckets)
+
+
+def _combine(validator, states):
+    """ Combines states in a tree of tasks. """
+    while len(states) > 1:
+        states = [delayed(_merge_states, pure=False)(validator, states[i:i + SPLIT_EVERY])
+                  for i in range(0, len(states), SPLIT_EVERY)]
+    return states[0]
+
+
+def _merge_states(validator, states):
+    return reduce(validator._merge_states, states)
+
+
+def _finish(validator, summary, *buckets):
+    """ Raises the violations between partitions that are known at the end, the hash partitions were merged without
+    violations if they got here. """
+    validator._finish_stream(summary)
+    return pd.Series([True])
+
+
+def _after(partition, passed):
+    """ Returns the partition once the validation between partitions passed. """
+    return partition
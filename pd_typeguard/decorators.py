@@ -1,167 +1,930 @@
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor
+from functools import wraps
+import asyncio
+import inspect
+import numpy as np
+import pandas as pd
 from .exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError,
                          ColumnNotUniqueError, ColumnNotSingleValueError)
+from . import arrow, config, dask_backend, instrumentation, parquet, polars_backend
+from .report import ValidationReport
+from .sampling import Sample
+from .cache import ValidationCache, default_cache
+from .deferred import DeferredPool, get_default_pool
+from .parallel import map_ordered
+from .incremental import IncrementalValidator
+
+
+def _null_count(series):
+    """ Number of null elements in a single column. Integer and boolean numpy columns cannot hold nulls, Arrow
+    columns know their null count. """
+    if series.dtype.kind in 'iub' and not hasattr(series.dtype, 'na_value'):
+        return 0
+    if arrow.is_arrow(series):
+        return arrow.null_count(series)
+    return len(series) - series.count()
+
+
+def _iter_chunks(values, first_chunk=1024, max_chunk=1048576):
+    """ Slices an array into chunks of growing size, so early mismatches are found after little work. """
+    start, size = 0, first_chunk
+    while start < len(values):
+        yield values[start:start + size]
+        start += size
+        size = min(2 * size, max_chunk)
+
+
+_NO_VALUE = object()
+
+
+def _scan_single_value(series, first=_NO_VALUE):
+    """ Finds the first non-null value of a column and the first value that differs from it.
+
+    Categorical columns are compared by their integer codes.
+
+    :param first: compare against this value instead of the first non-null value of the column.
+    :return: pair of values, with _NO_VALUE for the first value of an all-null column and for the other value if
+        there is none.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        codes = series.cat.codes.to_numpy()
+        if first is _NO_VALUE:
+            if len(categories) < 2:
+                return categories[0] if len(categories) and (codes >= 0).any() else _NO_VALUE, _NO_VALUE
+            first_code = _NO_VALUE
+        else:
+            first_code = categories.get_loc(first) if first in categories else -2  # -2 differs from all codes
+        first_code, other_code = _first_mismatch(codes, lambda chunk: chunk < 0, first_code)
+        if first is _NO_VALUE and first_code is not _NO_VALUE:
+            first = categories[first_code]
+        return first, _NO_VALUE if other_code is _NO_VALUE else categories[other_code]
+    if isinstance(series.dtype, np.dtype):
+        return _first_mismatch(series.to_numpy(), None if series.dtype.kind in 'iub' else pd.isna, first)
+    if arrow.is_arrow(series):
+        values = arrow.scan_single_value(series, first, _NO_VALUE)
+        if values is not None:
+            return values
+    return _first_mismatch(series.array, pd.isna, first)
+
+
+def _first_mismatch(values, isnull, first=_NO_VALUE):
+    """ Compares an array chunk by chunk against its first non-null element and stops at the first mismatch.
+
+    :param values: numpy or extension array
+    :param isnull: function returning the null mask of a chunk, None if the array cannot hold nulls.
+    :param first: compare against this value instead of the first non-null element.
+    :return: the first element and the first element that differs from it, _NO_VALUE if there is none.
+    """
+    if not len(values):
+        return first, _NO_VALUE
+    if first is _NO_VALUE and isnull is None and values[0] != values[-1]:  # sorted and range-like data
+        return values[0], values[-1]
+    for chunk in _iter_chunks(values):
+        if isnull is not None:
+            chunk = chunk[~np.asarray(isnull(chunk), dtype=bool)]
+            if not len(chunk):
+                continue
+        if first is _NO_VALUE:
+            first = chunk[0]
+        differs = np.asarray(chunk != first, dtype=bool)
+        if differs.any():
+            return first, chunk[differs.argmax()]
+    return first, _NO_VALUE
+
+
+def _find_duplicates(data):
+    """ Finds the duplicates of a column or of the rows of a DataFrame.
+
+    Columns use the hash table behind Series.is_unique. The rows of a DataFrame are hashed into a single uint64
+    array in one vectorized pass; only rows with colliding hashes are compared by value. Arrow-backed columns and
+    keys are checked by Arrow kernels instead. Columns with duplicates are
+    not scanned any further here, the exception looks them up when its diagnostics are read.
+
+    :return: None if there are no duplicates, else the rows holding them, a boolean mask marking the duplicates
+        among these rows (None to look them up with duplicated()) and the positions of these rows in data (None if
+        they are all rows of data).
+    """
+    if isinstance(data, pd.Series):
+        if arrow.is_arrow(data):
+            return (data, None, None) if arrow.has_duplicates(data) else None
+        if data.is_unique:
+            return None
+        return data, None, None
+    if len(data.columns) == 1:
+        return _find_duplicates(data.iloc[:, 0])
+    if all(isinstance(dtype, pd.ArrowDtype) for dtype in data.dtypes):
+        return (data, None, None) if arrow.has_duplicates(data) else None
+    hashes = pd.Series(_hash_rows(data))
+    if hashes.is_unique:
+        return None
+    positions = np.flatnonzero(hashes.duplicated(keep=False).to_numpy())
+    candidates = data.iloc[positions]
+    duplicates = candidates.duplicated().to_numpy()
+    if not duplicates.any():
+        return None
+    return candidates, duplicates, positions
+
+
+_NAN_HASH = pd.util.hash_array(np.array([np.nan]))[0]
+
+
+def _hash_column(series):
+    """ uint64 hash per element of a column. Numbers hash by value, whatever their dtype: 1 and 1.0 hash equally,
+    and so do NaN and NA, so that hashes match across chunks whose dtype changed, like int columns that are read
+    as float once a chunk has nulls. """
+    kind = series.dtype.kind
+    if kind not in 'iuf':
+        return pd.util.hash_pandas_object(series, index=False).to_numpy()
+    isnull = series.isna().to_numpy()
+    if kind in 'iu':
+        hashes = pd.util.hash_array(series.to_numpy(dtype=np.int64 if kind == 'i' else np.uint64, na_value=0))
+        hashes[isnull] = _NAN_HASH
+        return hashes
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    hashes = pd.util.hash_array(values)
+    with np.errstate(invalid='ignore'):
+        integral = (np.floor(values) == values) & (np.abs(values) < 2. ** 63)
+    hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    hashes[isnull] = _NAN_HASH
+    return hashes
+
+
+def _hash_rows(data):
+    """ uint64 hash per row of a column or a DataFrame, see _hash_column. """
+    if isinstance(data, pd.Series):
+        return _hash_column(data)
+    hashes = np.full(len(data), 0x345678, dtype=np.uint64)
+    for i in range(data.shape[1]):
+        hashes ^= _hash_column(data.iloc[:, i])
+        hashes *= np.uint64(1000003)
+    return hashes
+
+
+_NO_HASHES = ()  # row hashes as a tuple of sorted uint64 runs, see _find_seen
+
+
+def _find_seen(data, seen, item):
+    """ Finds the rows of data whose hash is in seen[item], and adds the hashes of data to it.
+
+    Used to find duplicates across chunks with a state of one hash per row, 8 bytes per row, kept as a tuple of
+    sorted uint64 runs of decreasing length (LSM style): the hashes of a chunk are added as a new run, and the last
+    runs are merged while a run is not longer than the one after it. A row is merged O(log(rows)) times, so the
+    cost of a chunk does not grow with the rows seen before, beyond the binary searches in O(log(rows)) runs. The
+    tuple is replaced, not modified, so a shallow copy of seen is a checkpoint of the state. A hash collision is
+    reported as a duplicate. Numbers are hashed by value, so dtypes may change between chunks, see _hash_column.
+
+    :param dict seen: tuples of sorted uint64 runs of the hashes of previous chunks.
+    :param item: the column or key of data.
+    :return: None if there are no rows seen before, else data, a boolean mask marking these rows and None, like
+        _find_duplicates.
+    """
+    hashes = _hash_rows(data)
+    runs = seen.get(item, _NO_HASHES)
+    if runs:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in runs:
+            positions = np.searchsorted(run, hashes)
+            found |= run[np.minimum(positions, len(run) - 1)] == hashes
+        if found.any():
+            return data, found, None
+    runs += (np.sort(hashes),)
+    while len(runs) > 1 and len(runs[-2]) <= len(runs[-1]):
+        runs = runs[:-2] + (np.sort(np.concatenate(runs[-2:]), kind='mergesort'),)
+    seen[item] = runs
+    return None
+
+
+def _merged_hashes(runs):
+    """ The hashes of a tuple of sorted runs as one sorted array. """
+    if len(runs) == 1:
+        return runs[0]
+    return np.sort(np.concatenate(runs), kind='mergesort') if runs else np.empty(0, dtype=np.uint64)
+
+
+def _merge_hashes(column, is_key, seen, other):
+    """ Merges the row hashes of two disjoint parts of a frame, like partitions, into one sorted run.
+
+    :param tuple seen: sorted runs of hashes, see _find_seen.
+    :param tuple other: sorted runs of hashes.
+    :raises ColumnNotUniqueError: if a hash is in both parts.
+    """
+    if not seen or not other:
+        return seen or other
+    merged = _merged_hashes(seen + other)
+    n_repeated = int(np.count_nonzero(merged[1:] == merged[:-1]))
+    if n_repeated:
+        name = 'Columns (%s) are' % ', '.join(str(col) for col in column) if is_key else 'Column %s is' % column
+        raise ColumnNotUniqueError('%s not unique! %i rows repeat rows of other partitions' % (name, n_repeated),
+                                   column=column, is_key=is_key)
+    return merged,
+
+
+def _merge_first(firsts, other):
+    """ Merges the first values of single value columns of two parts of a frame, see _merge_hashes. """
+    merged = dict(firsts)
+    for column, first in other.items():
+        if column not in merged:
+            merged[column] = first
+        elif merged[column] != first:
+            raise ColumnNotSingleValueError(column=column, values=(merged[column], first))
+    return merged
+
+
+def _validate_notnull_sample(validator, value, errors=None):
+    """ Validates a sample of a frame for a validator with not null constraints. A sample may only have nulls in an
+    'any' column that has values in the frame, so if the sample has null violations and there are 'any' columns, the
+    frame is validated in full. """
+    sample_errors = []
+    validator._validate_details(validator.sample.draw(value), False, errors=sample_errors)
+    if any(isinstance(error, ColumnNullError) for error in sample_errors) and 'any' in validator.notnull.values():
+        validator._validate_details(value, False, errors=errors)
+        return
+    for error in sample_errors:
+        validator._fail(error, errors)
+
+
+def _raise_all_null(state, notnull):
+    """ Raises ColumnNullError for the 'any' columns that only had nulls in a stream of rows, see _new_state of
+    ColumnNotNull. """
+    if state['n_rows'] and state['all_null']:
+        raise ColumnNullError(null_counts={column: state['n_rows'] for column in notnull
+                                           if column in state['all_null']},
+                              expected=notnull, n_rows=state['n_rows'])
+
+
+def _not_unique_error(column, is_key, duplicates):
+    """ :param duplicates: rows, mask and positions as returned by _find_duplicates. """
+    data, mask, row_positions = duplicates
+    return ColumnNotUniqueError(column=column, is_key=is_key, data=data, mask=mask, row_positions=row_positions)
+
+
+def _is_lazy(value):
+    """ dask DataFrames and polars LazyFrames, which validate returns as a new frame with the content checks. """
+    return dask_backend.is_dask(value) or polars_backend.is_lazy(value)
+
+
+def _column_index(columns):
+    """ Index of column names to look up in the columns of frames, keeping tuples as names. """
+    return pd.Index(columns, dtype=object, tupleize_cols=False)
+
+
+def _column_positions(columns, names):
+    """ Positions of the first column of each name in the columns Index of a frame, -1 for missing names. Resolved
+    by the hash table of the columns Index, so the cost depends on the number of names only. """
+    if columns.is_unique:
+        return columns.get_indexer(names)
+    first = ~columns.duplicated()
+    indexer = columns[first].get_indexer(names)
+    return np.where(indexer >= 0, np.flatnonzero(first)[indexer], -1)
+
+
+def _normalize_dtypes(dtypes, column_names):
+    """ Normalized expected dtypes as an object array, see arrow.normalize_dtype, and the positions of their columns
+    in the columns of a validator.
+
+    :param dict dtypes: expected dtypes.
+    :param Index column_names: the columns of the validator, see _column_index.
+    """
+    expected = np.empty(len(dtypes), dtype=object)
+    expected[:] = [arrow.normalize_dtype(dtype) for dtype in dtypes.values()]
+    return expected, column_names.get_indexer(_column_index(dtypes))
+
+
+def _wrong_dtypes(dtypes, expected, slots, actual):
+    """ Compares the dtypes of the columns of a validator with the normalized expected dtypes in one step.
+
+    :param dict dtypes: expected dtypes as declared, for the error.
+    :param expected: normalized expected dtypes and positions of their columns, see _normalize_dtypes.
+    :param actual: object array of the dtypes of the columns of the validator in a frame.
+    :return: dict of the columns of wrong dtype, pairs of actual and expected dtype.
+    """
+    actual = actual[slots]
+    wrong = np.flatnonzero(actual != expected)
+    if not len(wrong):
+        return {}
+    names = list(dtypes)
+    return {names[i]: (actual[i], dtypes[names[i]]) for i in wrong}
+
+
+def _same_positions(columns, layout):
+    """ Whether a columns Index has the columns of a layout at the same positions. A layout with missing columns is
+    only reused for an equal Index, as the other columns may include them. """
+    if layout.missing:
+        return columns.equals(layout.columns)
+    return len(columns) == len(layout.columns) and columns.take(layout.present).tolist() == list(layout.positions)
+
+
+def _dtypes_at(value, positions):
+    """ dtypes of the columns of a DataFrame at positions, read from their blocks without building value.dtypes. """
+    manager = value._mgr
+    blocks = manager.blocks
+    return tuple(blocks[number].dtype for number in manager.blknos[positions])
+
+
+class _Layout(object):
+
+    def __init__(self, columns, present, dtypes, positions, missing, wrong_dtypes):
+        """ Metadata of the columns of a frame for a validator, see HasColumn._layout.
+
+        :param Index columns: the columns of the frame.
+        :param present: positions in the frame of the columns of the validator it has.
+        :param tuple dtypes: dtypes of these columns. With columns, the signature of the layout.
+        :param dict positions: position in the frame of each column of the validator it has.
+        :param list missing: columns of the validator the frame does not have.
+        :param dict wrong_dtypes: columns of wrong dtype, pairs of actual and expected dtype.
+        """
+        self.columns = columns
+        self.present = present
+        self.dtypes = dtypes
+        self.positions = positions
+        self.missing = missing
+        self.wrong_dtypes = wrong_dtypes
+
+    def column(self, value, name):
+        return value.iloc[:, self.positions[name]]
+
+    def columns_of(self, value, names):
+        return value.iloc[:, [self.positions[name] for name in names]]
 
 
 class ReturnValueDecorator(metaclass=ABCMeta):
 
+    cache = None
+    executor = None
+    workers = None
+    stats = None
+    deferred = None
+    _signature = None
+    _runtime_options = ('cache', 'executor', 'workers', 'stats', 'deferred')
+
+    def __init__(self, cache=None, executor=None, workers=None, deferred=None):
+        """ Options common to all validators.
+
+        :param cache: skip the validation of return values that already passed an equal validator: True for the
+            shared default cache, or a ValidationCache. See ValidationCache for the limits of the staleness check.
+            dask DataFrames and polars LazyFrames are not cached.
+        :param executor: for coroutine functions, validate the awaited result in an executor instead of the event
+            loop: True for the default executor of the loop, or a concurrent.futures.Executor.
+        :param int workers: number of threads to validate columns in parallel, see parallel.set_default_workers for
+            the default.
+        :param deferred: return the results of functions and coroutine functions at once, and validate them in the
+            background: True for the shared default pool, or a DeferredPool. Violations are reported by the pool
+            instead of being raised, see DeferredPool. The chunks of generators are validated as they are yielded.
+            Lazy results, dask DataFrames and polars LazyFrames, are validated at once, as validating them only adds
+            the content checks to the returned frame.
+        """
+        self.cache = default_cache if cache is True else cache
+        if self.cache is not None and not isinstance(self.cache, ValidationCache):
+            raise TypeError('cache must be True, None or a ValidationCache, got %r' % (cache,))
+        if executor is not None and executor is not True and not isinstance(executor, Executor):
+            raise TypeError('executor must be True, None or a concurrent.futures.Executor, got %r' % (executor,))
+        if workers is not None and workers < 1:
+            raise ValueError('workers must be positive, got %r' % workers)
+        self.executor = executor
+        self.workers = workers
+        self.deferred = get_default_pool() if deferred is True else deferred
+        if self.deferred is not None and not isinstance(self.deferred, DeferredPool):
+            raise TypeError('deferred must be True, None or a DeferredPool, got %r' % (deferred,))
+
     def __call__(self, fcn):
-        """ To be used as function decorator. """
+        """ To be used as function decorator. The chunks of generator functions are validated as they are yielded,
+        see validate_stream. Coroutine functions and async generators are awaited before validation.
+
+        The wrapper carries the name, docstring and signature of fcn, and fcn as __wrapped__.
+
+        Returns fcn itself if validation is switched off for the process (see config.set_enabled), and skips the
+        validation inside a config.disabled() scope. """
+        if not config.is_enabled():
+            return fcn
+
+        if inspect.iscoroutinefunction(fcn):
+            @wraps(fcn)
+            async def inner(*args, **kwargs):
+                result = await fcn(*args, **kwargs)
+                if not config.is_enabled():
+                    return result
+                if self.deferred is not None and not _is_lazy(result):
+                    await self.deferred.submit_async(self, result, fcn)
+                    return result
+                return await self._run_async(self._validate_result, result)
+            return inner
+
+        if inspect.isasyncgenfunction(fcn):
+            @wraps(fcn)
+            async def inner(*args, **kwargs):
+                if not config.is_enabled():
+                    async for chunk in fcn(*args, **kwargs):
+                        yield chunk
+                    return
+                state = self._new_state()
+                async for chunk in fcn(*args, **kwargs):
+                    yield await self._run_async(self._validate_stream_chunk, chunk, state)
+                await self._run_async(self._finish_stream, state)
+            return inner
+
+        if inspect.isgeneratorfunction(fcn):
+            @wraps(fcn)
+            def inner(*args, **kwargs):
+                if not config.is_enabled():
+                    return fcn(*args, **kwargs)
+                return self.validate_stream(fcn(*args, **kwargs))
+            return inner
+
+        validate = self.validate
+        disabled_scope = config._disabled_scope
+
+        @wraps(fcn)
         def inner(*args, **kwargs):
             result = fcn(*args, **kwargs)
-            return self.validate(result)
-        
+            if not config._enabled or disabled_scope.get():  # config.is_enabled(), inlined
+                return result
+            if self.deferred is not None and not _is_lazy(result):
+                self.deferred.submit(self, result, fcn)
+                return result
+            if instrumentation._sinks or self.cache is not None:
+                return self._validate_result(result)
+            return validate(result)
+
         return inner
 
+    @property
+    def signature(self):
+        """ Hashable description of the validator type and its configuration. Validators with equal signatures
+        accept the same values. """
+        if self._signature is None:
+            self._signature = (type(self),) + tuple(sorted(
+                (name, repr(option)) for name, option in vars(self).items()
+                if name not in self._runtime_options and name[0] != '_'))
+        return self._signature
+
+    async def _run_async(self, fcn, *args):
+        if self.executor is None:
+            return fcn(*args)
+        executor = None if self.executor is True else self.executor
+        return await asyncio.get_running_loop().run_in_executor(executor, fcn, *args)
+
+    def _validate_result(self, value):
+        """ Validates a return value with the cache and instrumentation options. Stats are recorded while an
+        instrumentation sink is registered, see instrumentation.register_sink. """
+        if instrumentation._sinks:
+            validate = self.validate if self.cache is None else self._validate_cached
+            return instrumentation.measure(self, validate, value)
+        if self.cache is not None:
+            return self._validate_cached(value)
+        return self.validate(value)
+
+    def _validate_cached(self, value):
+        if _is_lazy(value):
+            # validate returns a new frame that carries the content checks, the value itself is not validated
+            return self.validate(value)
+        if (value, self.signature) in self.cache:
+            return value
+        result = self.validate(value)
+        self.cache.add(value, self.signature)
+        return result
+
     @abstractmethod
     def validate(self, value):
         """ Validates the return value of the decorated function. May be called directly on a value. """
         pass
 
+    def validate_stream(self, chunks):
+        """ Validates an iterable of chunks, like the DataFrames of pd.read_csv(chunksize=...), lazily.
+
+        Each chunk is yielded after it passed validation. Constraints on the whole stream (length, uniqueness, not
+        null values in 'any' mode, single value) are validated across chunks, with a state that does not keep the
+        chunks. Violations that are only known at the end are raised after the last chunk. The sample option does
+        not apply to streams. """
+        state = self._new_state()
+        for chunk in chunks:
+            yield self._validate_stream_chunk(chunk, state)
+        self._finish_stream(state)
+
+    def _validate_stream_chunk(self, chunk, state):
+        if instrumentation._sinks:
+            return instrumentation.measure(self, self._validate_chunk, chunk, state)
+        return self._validate_chunk(chunk, state)
+
+    def incremental(self):
+        """ Returns an IncrementalValidator, to validate the batches of an append-only table across validate calls.
+        """
+        return IncrementalValidator(self)
+
+    def _new_state(self):
+        return {}
+
+    def _merge_states(self, state, other):
+        """ Combines the states of two consecutive parts of a frame, validated as streams of one chunk each, like the
+        partitions of a dask DataFrame. Raises violations between the parts. """
+        return dict(state)
+
+    def _validate_chunk(self, chunk, state):
+        return self.validate(chunk)
+
+    def _finish_stream(self, state):
+        pass
+
+    @staticmethod
+    def _errors_for_mode(mode):
+        """ None to raise on the first violation, or a list to collect all violations in. """
+        if mode == 'raise':
+            return None
+        if mode == 'report':
+            return []
+        raise ValueError('mode must be "raise" or "report", got %r' % (mode,))
+
+    @staticmethod
+    def _fail(error, errors):
+        """ Raises the error, or collects it if a list of errors is given. """
+        if errors is None:
+            raise error
+        errors.append(error)
+
 
 class NotEmpty(ReturnValueDecorator):
 
-    def __init__(self, allow_none=False, allow_scalar=True):
+    def __init__(self, allow_none=False, allow_scalar=True, **kwargs):
         """ Raises DFEmpty if the return value has a length of 0 or is None.
 
         :param bool allow_none: make None a valid return value.
-        :param bool allow_scalar: do not raise if the return value has no length. """
+        :param bool allow_scalar: do not raise if the return value has no length.
+        :param kwargs: options of ReturnValueDecorator. """
+        super(NotEmpty, self).__init__(**kwargs)
         self.allow_none = allow_none
         self.allow_scalar = allow_scalar
         
-    def validate(self, value):
+    def validate(self, value, mode='raise'):
+        """ :param str mode: 'raise' to raise the violation, 'report' to return a ValidationReport.
+
+        dask DataFrames and polars LazyFrames are returned with their row count validated on computation, see
+        dask_backend and polars_backend. """
+        errors = None if mode == 'raise' else self._errors_for_mode(mode)
         if value is None:
             if not self.allow_none:
-                raise DFEmptyError('return value is None')
-            return None
+                self._fail(DFEmptyError('return value is None'), errors)
+        elif dask_backend.is_dask(value):
+            value = dask_backend.validate_partitions(self, value)
+        elif polars_backend.is_lazy(value):
+            value = polars_backend.validate_length(value)
+        else:
+            try:
+                if not len(value):
+                    self._fail(DFEmptyError('value is empty %s' % type(value)), errors)
+            except TypeError:
+                if not self.allow_scalar:
+                    self._fail(DFEmptyError('value is of scalar type %r' % type(value)), errors)
+        return value if errors is None else ValidationReport(self, errors)
+
+    def _new_state(self):
+        return {'n_items': 0}
+
+    def _merge_states(self, state, other):
+        merged = super(NotEmpty, self)._merge_states(state, other)
+        merged['n_items'] += other['n_items']
+        return merged
+
+    def _validate_chunk(self, chunk, state):
+        if chunk is None:
+            return self.validate(chunk)
         try:
-            if not len(value):
-                raise DFEmptyError('value is empty %s' % type(value))
+            state['n_items'] += len(chunk)
         except TypeError:
             if not self.allow_scalar:
-                raise DFEmptyError('value is of scalar type %r' % type(value))
-        return value
+                raise DFEmptyError('chunk is of scalar type %r' % type(chunk))
+            state['n_items'] += 1
+        return chunk
+
+    def _finish_stream(self, state):
+        if not state['n_items']:
+            raise DFEmptyError('stream has no items')
 
 
 class HasColumn(ReturnValueDecorator):
 
-    def __init__(self, columns, allow_none=False, allow_empty=False):
+    _dtype_plan = None  # normalized expected dtypes, see _normalize_dtypes
+
+    def __init__(self, columns, allow_none=False, allow_empty=False, sample=None, **kwargs):
         """ Raises MissingColumnError if a column in the result is missing.
 
         :param iterable columns: list of columns
         :param bool allow_none: make None a valid return value.
         :param bool allow_empty: allow a DataFrame of length zero, if it has the required columns
+        :param sample: validate the content of a subset of rows only: a Sample, a float fraction or an int row
+            count. Columns, dtypes and the length are always validated in full. Violations found in the sample
+            are real, but passing frames are only validated up to sample.guarantee(len(frame)).
+        :param kwargs: options of ReturnValueDecorator.
         """
-        self.columns = set(columns)
+        super(HasColumn, self).__init__(**kwargs)
+        self._column_order = list(dict.fromkeys(columns))
+        self.columns = set(self._column_order)
+        self._column_names = _column_index(self._column_order)
+        self._last_layout = None
         self.allow_none = allow_none
         self.allow_empty = allow_empty
+        self.sample = Sample.from_spec(sample)
 
-    def _validate_has_columns(self, value):
-        try:
-            missing_columns = self.columns - set(value.columns)
-        except AttributeError:
+    def _validate_has_columns(self, value, errors=None):
+        """ Returns False if columns are missing. """
+        if not hasattr(value, 'columns'):
             raise AttributeError('Return value of type "%s" does not must have the "columns" attribute. '
                                  '(expected DataFrame)' % type(value))
-        if len(missing_columns):
-            raise MissingColumnError('missing columns: ' + ','.join(missing_columns))
-
-    def _validate_empty(self, value):
+        missing = self._layout(value).missing
+        if len(missing):
+            self._fail(MissingColumnError(columns=missing), errors)
+            return False
+        return True
+
+    def _layout(self, value):
+        """ Positions, missing columns and wrong dtypes of the columns of a frame. The layout is compiled once and
+        reused while frames have the columns of the validator at the same positions, with the same dtypes, so that
+        repeated validations of frames of one layout only run the data checks. Checking the reuse only reads the
+        columns of the validator, not the other columns of the frame. """
+        columns = value.columns
+        layout = self._last_layout
+        if layout is not None and (columns is layout.columns or _same_positions(columns, layout)) \
+                and _dtypes_at(value, layout.present) == layout.dtypes:
+            return layout
+        positions = _column_positions(columns, self._column_names)
+        present = positions[positions >= 0]
+        actual = value.dtypes.to_numpy()[present]
+        missing = [self._column_order[i] for i in np.flatnonzero(positions < 0)]
+        wrong_dtypes = {}
+        if not missing and self._dtype_plan is not None:
+            wrong_dtypes = _wrong_dtypes(self.dtypes, *self._dtype_plan, actual)
+        layout = _Layout(columns, present, tuple(actual), dict(zip(
+            (column for column, position in zip(self._column_order, positions) if position >= 0), present.tolist())),
+            missing, wrong_dtypes)
+        self._last_layout = layout
+        return layout
+
+    def _validate_empty(self, value, errors=None):
         if not len(value):
-            if self.allow_empty:
-                return True
-            else:
-                raise DFEmptyError('Return value of type %s has length 0.' % type(value))
+            if not self.allow_empty:
+                self._fail(DFEmptyError('Return value of type %s has length 0.' % type(value)), errors)
+            return True
         return False
 
-    def _validate_details(self, value, is_empty):
+    def _validate_details(self, value, is_empty, state=None, errors=None):
+        """ Validates the content of a DataFrame, or of a chunk of a stream if state is given. Violations are
+        raised, or collected if a list of errors is given. """
         pass
 
-    def validate(self, value):
+    def _validate_sample(self, value, errors=None):
+        self._validate_details(self.sample.draw(value), False, errors=errors)
+
+    def validate_parquet(self, source, mode='raise'):
+        """ Validates a Parquet file or dataset from its footer statistics, mostly without reading data, see parquet.
+
+        :param source: path of a file or directory, list of paths, or a pyarrow Dataset.
+        :param str mode: see validate.
+        :return: source, or a ValidationReport in report mode.
+        """
+        errors = self._errors_for_mode(mode)
+        parquet.validate(self, source, errors)
+        return source if errors is None else ValidationReport(self, errors)
+
+    def _parquet_constraints(self):
+        """ Constraints answered by Parquet statistics: a dict of not null constraints like ColumnNotNull, and a list
+        of single value columns. """
+        return {}, []
+
+    def _parquet_residual(self):
+        """ Validator of the constraints that Parquet statistics cannot answer, None if there are none. """
+        return None
+
+    def _validate_polars_schema(self, schema, errors=None):
+        """ Validates the dtypes of a polars frame, see polars_backend. """
+        pass
+
+    def _polars_checks(self):
+        """ Content checks of a polars frame as pairs of scalar expressions and a function (frame, results, errors)
+        validating their results, see polars_backend. """
+        return []
+
+    def validate(self, value, mode='raise'):
+        """ :param str mode: 'raise' to raise the first violation, 'report' to return a ValidationReport of all
+            violations. The content is not validated if columns are missing.
+
+        Besides pandas DataFrames, accepts pyarrow Tables (see arrow), polars DataFrames and LazyFrames (see
+        polars_backend) and dask DataFrames (see dask_backend). LazyFrames and dask DataFrames are returned with
+        their content validation added to the computation. """
+        errors = None if mode == 'raise' else self._errors_for_mode(mode)
         if value is None:
             if not self.allow_none:
-                raise DFEmptyError('Return value must not be None.')
-            return None
-        self._validate_has_columns(value)
-        is_empty = self._validate_empty(value)
-        self._validate_details(value, is_empty)
-        return value
+                self._fail(DFEmptyError('Return value must not be None.'), errors)
+            return None if errors is None else ValidationReport(self, errors)
+        if polars_backend.is_polars(value):
+            value = polars_backend.validate(self, value, errors)
+            return value if errors is None else ValidationReport(self, errors)
+        if dask_backend.is_dask(value):
+            value = dask_backend.validate(self, value, errors)
+            return value if errors is None else ValidationReport(self, errors)
+        frame = arrow.as_frame(value)
+        if self._validate_has_columns(frame, errors):
+            is_empty = self._validate_empty(frame, errors)
+            if self.sample is None or is_empty:
+                self._validate_details(frame, is_empty, errors=errors)
+            else:
+                self._validate_sample(frame, errors)
+        return value if errors is None else ValidationReport(self, errors)
+
+    def _new_state(self):
+        return {'n_rows': 0}
+
+    def _merge_states(self, state, other):
+        merged = super(HasColumn, self)._merge_states(state, other)
+        merged['n_rows'] += other['n_rows']
+        return merged
+
+    def _validate_chunk(self, chunk, state):
+        if chunk is None:
+            return self.validate(chunk)
+        frame = arrow.as_frame(polars_backend.to_arrow(chunk))
+        self._validate_has_columns(frame)
+        state['n_rows'] += len(frame)
+        self._validate_details(frame, not len(frame), state)
+        return chunk
+
+    def _finish_stream(self, state):
+        if not state['n_rows'] and not self.allow_empty:
+            raise DFEmptyError('Stream has no rows.')
 
 
 class ColumnHasDtype(HasColumn):
 
-    def __init__(self, dtypes, allow_none=False, allow_empty=False):
+    def __init__(self, dtypes, allow_none=False, allow_empty=False, sample=None, **kwargs):
         """ Raises WrongDtypeError if the returned DataFrame has columns of wrong type.
 
-        :param dict dtypes: pairs column name with expected dtype.
+        :param dict dtypes: pairs column name with expected dtype. Polars columns also match the pandas dtype they
+            convert to, see polars_backend.
         :param bool allow_none: make None a valid return value.
         :param bool allow_empty: allow a DataFrame of length zero, if it has the required columns
+        :param sample: see HasColumn.
+        :param kwargs: options of ReturnValueDecorator.
         """
-        super(ColumnHasDtype, self).__init__([x for x in dtypes], allow_none=allow_none, allow_empty=allow_empty)
+        super(ColumnHasDtype, self).__init__([x for x in dtypes], allow_none=allow_none, allow_empty=allow_empty,
+                                             sample=sample, **kwargs)
         self.dtypes = {x: y for x, y in dtypes.items()}  # type check on creation
+        self._dtype_plan = _normalize_dtypes(self.dtypes, self._column_names)
+
+    def _validate_details(self, value, is_empty, state=None, errors=None):
+        wrong_dtypes = self._layout(value).wrong_dtypes
+        if wrong_dtypes:
+            self._fail(WrongDtypeError(dtypes=dict(wrong_dtypes)), errors)
 
-    def _validate_details(self, value, is_empty):
-        wrong_dtypes = []
-        for column, dtype in self.dtypes.items():
-            if value[column].dtype != dtype:
-                wrong_dtypes.append(column)
-        if len(wrong_dtypes):
-            raise WrongDtypeError('Columns with wrong dtypes: ' + ', '.join('%s: %s (expected %s)' % (
-                column, value[column].dtype, self.dtypes[column]
-            ) for column in wrong_dtypes))
+    def _validate_polars_schema(self, schema, errors=None):
+        error = polars_backend.dtype_error(self.dtypes, schema)
+        if error is not None:
+            self._fail(error, errors)
 
 
 class ColumnNotNull(HasColumn):
 
-    def __init__(self, col_notnull, allow_none=False, allow_empty=False):
+    def __init__(self, col_notnull, allow_none=False, allow_empty=False, sample=None, **kwargs):
         """ Raises ColumnNullError if the returned DataFrame has columns that contain null elements.
 
         :param dict col_notnull: pairs column name with expected content: 'all' if all values must not be null,
             'any' if one or more values must not be null.
         :param bool allow_none: make None a valid return value.
         :param bool allow_empty: allow a DataFrame of length zero, if it has the required columns
+        :param sample: see HasColumn. A sample without any non-null value does not prove an 'any' violation, the
+            full frame is validated in that case.
+        :param kwargs: options of ReturnValueDecorator.
         """
-        super(ColumnNotNull, self).__init__([x for x in col_notnull], allow_none=allow_none, allow_empty=allow_empty)
+        super(ColumnNotNull, self).__init__([x for x in col_notnull], allow_none=allow_none, allow_empty=allow_empty,
+                                            sample=sample, **kwargs)
         self.notnull = {x: y for x, y in col_notnull.items()}  # type check on creation
 
-    def _validate_details(self, value, is_empty):
+    def _validate_sample(self, value, errors=None):
+        _validate_notnull_sample(self, value, errors)
+
+    def _new_state(self):
+        state = super(ColumnNotNull, self)._new_state()
+        state['all_null'] = {column for column, notnull in self.notnull.items() if notnull == 'any'}
+        return state
+
+    def _merge_states(self, state, other):
+        merged = super(ColumnNotNull, self)._merge_states(state, other)
+        merged['all_null'] = state['all_null'] & other['all_null']
+        return merged
+
+    def _validate_details(self, value, is_empty, state=None, errors=None):
         if is_empty:
             return
-        wrong_content = []
-        null_per_column = value.isnull().sum()
-        notnull_all = [colname for colname in null_per_column[null_per_column == 0].index]
-        notnull_any = [colname for colname in null_per_column[null_per_column < len(value)].index]
-        for column, notnull in self.notnull.items():
-            if notnull == 'any':
-                if column not in notnull_any:
-                    wrong_content.append(column)
-            if notnull == 'all':
-                if column not in notnull_all:
-                    wrong_content.append(column)
+        layout = self._layout(value)
+        null_per_column = dict(zip(self.notnull, map_ordered(lambda column: _null_count(layout.column(value, column)),
+                                                             self.notnull, self.workers)))
+        wrong_content = [column for column, notnull in self.notnull.items()
+                         if (notnull == 'all' and null_per_column[column] > 0)
+                         or (notnull == 'any' and null_per_column[column] == len(value) and state is None)]
         if len(wrong_content):
-            raise ColumnNullError('Unexpected Null values in columns of length %i: ' % len(value) +
-                                  ', '.join('%s: %i (not null expected: %s)' % (
-                                      column, null_per_column.loc[column], self.notnull[column]
-                                  ) for column in wrong_content))
+            self._fail(ColumnNullError(null_counts={column: null_per_column[column] for column in wrong_content},
+                                       expected=self.notnull, n_rows=len(value),
+                                       data={column: layout.column(value, column) for column in wrong_content}),
+                       errors)
+        if state is not None:
+            state['all_null'] -= {column for column in state['all_null'] if null_per_column[column] < len(value)}
+
+    def _polars_checks(self):
+        return [polars_backend.notnull_check(self, self.notnull)]
+
+    def _parquet_constraints(self):
+        return self.notnull, []
+
+    def _finish_stream(self, state):
+        super(ColumnNotNull, self)._finish_stream(state)
+        _raise_all_null(state, self.notnull)
 
 
 class ColumnUnique(HasColumn):
 
-    def _validate_details(self, value, is_empty):
+    def __init__(self, columns, allow_none=False, allow_empty=False, keys=None, sample=None, **kwargs):
+        """ Raises ColumnNotUniqueError if the returned DataFrame has duplicates in a column or a composite key.
+
+        :param iterable columns: columns that must be unique on their own.
+        :param bool allow_none: make None a valid return value.
+        :param bool allow_empty: allow a DataFrame of length zero, if it has the required columns
+        :param iterable keys: groups of columns that must be unique in combination, like [('account_id', 'date')].
+        :param sample: see HasColumn. Duplicates are only found if all of their rows are sampled.
+        :param kwargs: options of ReturnValueDecorator.
+        """
+        columns = list(columns)
+        self.keys = [tuple(key) for key in (keys or [])]
+        super(ColumnUnique, self).__init__(columns + [col for key in self.keys for col in key],
+                                           allow_none=allow_none, allow_empty=allow_empty, sample=sample,
+                                           **kwargs)
+        self.unique_columns = columns
+
+    def _new_state(self):
+        state = super(ColumnUnique, self)._new_state()
+        state['hashes'] = {item: _NO_HASHES for item in self._unique_items()}
+        return state
+
+    def _merge_states(self, state, other):
+        merged = super(ColumnUnique, self)._merge_states(state, other)
+        merged['hashes'] = {item: _merge_hashes(item[0], item[1], state['hashes'][item], other['hashes'][item])
+                            for item in self._unique_items()}
+        return merged
+
+    def _validate_details(self, value, is_empty, state=None, errors=None):
         if is_empty:
             return
-        for col in self.columns:
-            duplicates = value[col].duplicated()
-            if duplicates.any():
-                raise ColumnNotUniqueError(
-                    'Column %s is not unique! First duplicate item: %r' % (col, value[col][duplicates].iloc[0]))
+        items = self._unique_items()
+        layout = self._layout(value)
+
+        def find_duplicates(item):
+            column, is_key = item
+            data = layout.columns_of(value, column) if is_key else layout.column(value, column)
+            duplicates = _find_duplicates(data)
+            if duplicates is None and state is not None:
+                duplicates = _find_seen(data, state['hashes'], item)
+            return duplicates
+
+        for (column, is_key), duplicates in zip(items, map_ordered(find_duplicates, items, self.workers)):
+            if duplicates is not None:
+                self._fail(_not_unique_error(column, is_key, duplicates), errors)
+
+    def _polars_checks(self):
+        return [polars_backend.unique_check(self, column, is_key) for column, is_key in self._unique_items()]
+
+    def _parquet_residual(self):
+        return self
+
+    def _unique_items(self):
+        """ Columns and keys that must be unique, as pairs (column or key, is_key). """
+        return [(column, False) for column in self.unique_columns] + [(key, True) for key in self.keys]
 
 
 class ColumnSingleValue(HasColumn):
 
-    def _validate_details(self, value, is_empty):
+    def _new_state(self):
+        state = super(ColumnSingleValue, self)._new_state()
+        state['first'] = {}
+        return state
+
+    def _merge_states(self, state, other):
+        merged = super(ColumnSingleValue, self)._merge_states(state, other)
+        merged['first'] = _merge_first(state['first'], other['first'])
+        return merged
+
+    def _validate_details(self, value, is_empty, state=None, errors=None):
         if is_empty:
             return
-        for col in self.columns:
-            if value[col].nunique() > 1:
-                raise ColumnNotSingleValueError(
-                    'Column %s has multiple values! First two values: %r' % (col, value[col].unique()[:2]))
+        firsts = {} if state is None else state['first']
+        layout = self._layout(value)
+        scans = map_ordered(lambda col: _scan_single_value(layout.column(value, col), firsts.get(col, _NO_VALUE)),
+                            self._column_order, self.workers)
+        for col, (first, other) in zip(self._column_order, scans):
+            if other is not _NO_VALUE:
+                self._fail(ColumnNotSingleValueError(column=col, values=(first, other),
+                                                     data=layout.column(value, col)), errors)
+            if state is not None and first is not _NO_VALUE:
+                state['first'][col] = first
+
+    def _polars_checks(self):
+        return [polars_backend.single_value_check(self, column) for column in self._column_order]
+
+    def _parquet_constraints(self):
+        return {}, self._column_order
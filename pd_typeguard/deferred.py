@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Condition, Lock
+import asyncio
+import queue
+
+
+class DeferredPool(object):
+
+    def __init__(self, workers=1, max_pending=16, block=True, on_error=None, max_errors=100):
+        """ Validates return values in background threads, so that decorated functions return without waiting for
+        their validation, see the deferred option of ReturnValueDecorator.
+
+        Values are passed to the validating thread by reference, never copied: the caller must not modify a frame
+        before its validation is done. Violations are passed to on_error, or put into the errors queue as pairs of
+        the decorated function and the exception. The diagnostics of the exceptions (row positions, values) are
+        computed in the validating thread before they are reported, and the exceptions are reported without their
+        traceback and keep no reference to the validated frame: a queued violation costs its message and up to
+        max_samples positions and values.
+
+        :param int workers: number of validating threads.
+        :param int max_pending: number of values submitted and not validated yet. Bounds the frames kept alive by
+            the pool.
+        :param bool block: if max_pending values are pending, wait for a free slot in submit, which slows down the
+            caller to the pace of validation. Coroutines await the slot without blocking the event loop. Else the
+            value is not validated, and counted in skipped.
+        :param on_error: callable(fcn, error), called in the validating thread for each violation.
+        :param int max_errors: size of the errors queue, further violations are counted in dropped_errors.
+        """
+        if workers < 1:
+            raise ValueError('workers must be positive, got %r' % workers)
+        if max_pending < 1:
+            raise ValueError('max_pending must be positive, got %r' % max_pending)
+        self.block = block
+        self.on_error = on_error
+        self.errors = queue.Queue(max_errors)
+        self.skipped = 0
+        self.dropped_errors = 0
+        self._slots = BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._done = Condition()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='pd_typeguard_deferred')
+        self._waiters = ThreadPoolExecutor(thread_name_prefix='pd_typeguard_deferred_wait')
+
+    def submit(self, validator, value, fcn=None):
+        """ Schedules the validation of a return value.
+
+        :param ReturnValueDecorator validator: validates the value, with its cache and instrumentation options. The
+            result of validate is discarded, so lazy frames whose content checks are added to the returned frame
+            must be validated by the caller.
+        :param fcn: the function that returned value, passed on with violations.
+        :return: False if the validation was skipped because max_pending values are pending.
+        """
+        if not self._slots.acquire(blocking=self.block):
+            return self._skip()
+        return self._start(validator, value, fcn)
+
+    async def submit_async(self, validator, value, fcn=None):
+        """ submit for coroutines: waits for a free slot in a waiting thread instead of blocking the event loop. A
+        slot acquired for a cancelled coroutine is released again. """
+        if not self._slots.acquire(blocking=False):
+            if not self.block:
+                return self._skip()
+            acquired = self._waiters.submit(self._slots.acquire)
+            try:
+                await asyncio.shield(asyncio.wrap_future(acquired))
+            except asyncio.CancelledError:
+                acquired.add_done_callback(lambda _: self._slots.release())
+                raise
+        return self._start(validator, value, fcn)
+
+    def _skip(self):
+        with self._done:
+            self.skipped += 1
+        return False
+
+    def _start(self, validator, value, fcn):
+        with self._done:
+            self._pending += 1
+        try:
+            self._executor.submit(self._validate, validator, value, fcn)
+        except BaseException:
+            self._release()
+            raise
+        return True
+
+    def _validate(self, validator, value, fcn):
+        try:
+            validator._validate_result(value)
+        except Exception as error:
+            self._report(fcn, error)
+        finally:
+            self._release()
+
+    def _report(self, fcn, error):
+        if hasattr(error, '_detach'):
+            error._detach()
+        error.__traceback__ = None
+        if self.on_error is not None:
+            self.on_error(fcn, error)
+            return
+        try:
+            self.errors.put_nowait((fcn, error))
+        except queue.Full:
+            with self._done:
+                self.dropped_errors += 1
+
+    def _release(self):
+        with self._done:
+            self._pending -= 1
+            self._done.notify_all()
+        self._slots.release()
+
+    @property
+    def pending(self):
+        """ Number of values submitted and not validated yet. """
+        return self._pending
+
+    def join(self, timeout=None):
+        """ Waits until all submitted values are validated. Returns False if the timeout in seconds passed first. """
+        with self._done:
+            return self._done.wait_for(lambda: not self._pending, timeout)
+
+    def __repr__(self):
+        return 'DeferredPool(pending=%i, errors=%i, skipped=%i, dropped_errors=%i)' % (
+            self._pending, self.errors.qsize(), self.skipped, self.dropped_errors)
+
+
+_default_pool = None
+_default_pool_lock = Lock()
+
+
+def get_default_pool():
+    """ The pool of deferred=True, created on first use. """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = DeferredPool()
+        return _default_pool
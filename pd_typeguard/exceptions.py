@@ -1,6 +1,51 @@
+import numpy as np
+
+max_samples = 5  # number of row positions and values collected for diagnostics
+
+
 class ReturnValueError(Exception):
-    """ Superclass for detailed exceptions. """
-    pass
+    """ Superclass for detailed exceptions.
+
+    Subclasses carry the details of the violation as attributes. The message is only formatted on str(), and
+    diagnostics that need a scan over the data (counts, row positions, values) are only computed when they are read,
+    so that catching the exception costs nothing beyond the check that found the violation. For the same reason,
+    args only holds a message given on creation, and is empty otherwise: read the message with str(error), or
+    repr(error), which formats it too. Pickled exceptions keep their message and their plain attributes, but not the
+    data the diagnostics are computed from. """
+
+    _data = None
+
+    def __init__(self, message=None):
+        super(ReturnValueError, self).__init__(*(() if message is None else (message,)))
+        self._message = message
+
+    def _format(self):
+        return ''
+
+    def __str__(self):
+        if self._message is None:
+            self._message = self._format()
+        return self._message
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, str(self))
+
+    def _get_data(self):
+        """ The data the diagnostics are computed from, None if it is gone. A function given as data is called on
+        first use, to defer conversions. """
+        if callable(self._data):
+            self._data = self._data()
+        return self._data
+
+    def _detach(self):
+        """ Computes the message and the diagnostics, and drops the data they are computed from, so that the
+        exception no longer keeps the validated frame alive. """
+        str(self)
+        self._data = None
+
+    def __reduce__(self):
+        state = {name: value for name, value in vars(self).items() if not name.startswith('_')}
+        return type(self), (str(self),), state
 
 
 class DFEmptyError(ReturnValueError):
@@ -10,24 +55,184 @@ class DFEmptyError(ReturnValueError):
 
 class MissingColumnError(ReturnValueError):
     """ Method returns DataFrame without required column. """
-    pass
+
+    def __init__(self, message=None, columns=()):
+        super(MissingColumnError, self).__init__(message)
+        self.columns = list(columns)
+
+    def _format(self):
+        return 'missing columns: ' + ','.join(str(column) for column in self.columns)
 
 
 class WrongDtypeError(ReturnValueError):
     """ Return value has wrong Dtypes. """
-    pass
+
+    def __init__(self, message=None, dtypes=None):
+        """ :param dict dtypes: pairs column name with (actual dtype, expected dtype). """
+        super(WrongDtypeError, self).__init__(message)
+        self.dtypes = dict(dtypes or {})
+
+    def _format(self):
+        return 'Columns with wrong dtypes: ' + ', '.join('%s: %s (expected %s)' % (column, actual, expected)
+                                                         for column, (actual, expected) in self.dtypes.items())
 
 
 class ColumnNullError(ReturnValueError):
     """ A column is unexpectedly empty. """
-    pass
+
+    def __init__(self, message=None, null_counts=None, expected=None, n_rows=None, data=None):
+        """ :param dict null_counts: pairs column name with its number of null values.
+        :param dict expected: pairs column name with the not null constraint, 'all' or 'any'.
+        :param int n_rows: length of the validated frame or stream.
+        :param data: the validated DataFrame or a dict of its columns, or a function returning it, to look up
+            positions on demand.
+        """
+        super(ColumnNullError, self).__init__(message)
+        self.null_counts = dict(null_counts or {})
+        self.expected = dict(expected or {})
+        self.n_rows = n_rows
+        self._data = data
+        self._positions = None
+
+    @property
+    def columns(self):
+        return list(self.null_counts)
+
+    @property
+    def positions(self):
+        """ Pairs column name with up to max_samples row positions of null values, None if the data is gone. """
+        data = self._get_data()
+        if self._positions is None and data is not None:
+            self._positions = {column: np.flatnonzero(data[column].isna().to_numpy())[:max_samples].tolist()
+                               for column in self.null_counts}
+        return self._positions
+
+    def _detach(self):
+        self.positions
+        super(ColumnNullError, self)._detach()
+
+    def _format(self):
+        if self.n_rows is None:
+            return 'Unexpected Null values in columns: ' + ', '.join(str(column) for column in self.null_counts)
+        return 'Unexpected Null values in columns of length %i: ' % self.n_rows + ', '.join(
+            '%s: %i (not null expected: %s)' % (column, n_null, self.expected.get(column))
+            for column, n_null in self.null_counts.items())
 
 
 class ColumnNotUniqueError(ReturnValueError):
     """ A column is unexpectedly not unique. """
-    pass
+
+    def __init__(self, message=None, column=None, is_key=False, data=None, mask=None, row_positions=None):
+        """ :param column: name of the column, or tuple of the columns of a composite key.
+        :param bool is_key: column is a composite key.
+        :param data: Series or DataFrame with the duplicate rows, or a function returning it.
+        :param mask: boolean array marking the rows of data that repeat an earlier row, data.duplicated() if None.
+        :param row_positions: positions of the rows of data in the validated frame, if data is a subset.
+        """
+        super(ColumnNotUniqueError, self).__init__(message)
+        self.column = column
+        self.is_key = is_key
+        self._data = data
+        self._mask = mask
+        self._row_positions = row_positions
+        self._n_duplicates = self._positions = self._values = None
+
+    def _duplicates(self):
+        data = self._get_data()
+        if self._mask is None and data is not None:
+            self._mask = data.duplicated().to_numpy()
+        return self._mask
+
+    @property
+    def n_duplicates(self):
+        """ Number of rows that repeat an earlier row, None if the data is gone. """
+        mask = self._duplicates()
+        if self._n_duplicates is None and mask is not None:
+            self._n_duplicates = int(mask.sum())
+        return self._n_duplicates
+
+    @property
+    def positions(self):
+        """ Up to max_samples row positions of duplicates. """
+        mask = self._duplicates()
+        if self._positions is None and mask is not None:
+            positions = np.flatnonzero(mask)[:max_samples]
+            if self._row_positions is not None:
+                positions = np.asarray(self._row_positions)[positions]
+            self._positions = positions.tolist()
+        return self._positions
+
+    @property
+    def values(self):
+        """ Up to max_samples duplicate items, tuples for composite keys. """
+        mask = self._duplicates()
+        if self._values is None and mask is not None:
+            rows = self._get_data().iloc[np.flatnonzero(mask)[:max_samples]]
+            if rows.ndim == 2:
+                self._values = [tuple(row) for row in rows.itertuples(index=False)]
+            else:
+                self._values = rows.tolist()
+        return self._values
+
+    def _detach(self):
+        self.positions
+        super(ColumnNotUniqueError, self)._detach()
+        self._mask = self._row_positions = None
+
+    def _format(self):
+        values = self.values
+        if self.is_key:
+            return 'Columns (%s) are not unique! %i duplicate rows, first duplicate item: %r' % (
+                ', '.join(str(col) for col in self.column), self.n_duplicates, values[0])
+        return 'Column %s is not unique! %i duplicate rows, first duplicate item: %r' % (
+            self.column, self.n_duplicates, values[0])
 
 
 class ColumnNotSingleValueError(ReturnValueError):
     """ A column contains more than one distinct values. """
-    pass
+
+    def __init__(self, message=None, column=None, values=(), data=None):
+        """ :param column: name of the column.
+        :param tuple values: two distinct values of the column.
+        :param data: the column or a function returning it, to look up positions on demand.
+        """
+        super(ColumnNotSingleValueError, self).__init__(message)
+        self.column = column
+        self.values = tuple(values)
+        self._data = data
+        self._positions = None
+
+    @property
+    def positions(self):
+        """ Up to max_samples row positions of values that differ from the first value, None if the data is gone. """
+        data = self._get_data()
+        if self._positions is None and data is not None:
+            differs = data.notna().to_numpy() & (data != self.values[0]).to_numpy()
+            self._positions = np.flatnonzero(differs)[:max_samples].tolist()
+        return self._positions
+
+    def _detach(self):
+        self.positions
+        super(ColumnNotSingleValueError, self)._detach()
+
+    def _format(self):
+        return 'Column %s has multiple values! First two values: %r' % (self.column, self.values)
+
+
+class ValidationReportError(ReturnValueError):
+    """ Return value violates one or more constraints, see the report attribute for all of them. """
+
+    def __init__(self, report):
+        super(ValidationReportError, self).__init__()
+        self.report = report
+
+    def _format(self):
+        return str(self.report)
+
+    def _detach(self):
+        for error in self.report:
+            error._detach()
+        super(ValidationReportError, self)._detach()
+
+    def __reduce__(self):
+        return type(self), (self.report,)
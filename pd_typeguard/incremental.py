@@ -0,0 +1,56 @@
+from copy import copy
+from threading import Lock
+
+
+class IncrementalValidator(object):
+
+    def __init__(self, validator):
+        """ Validates the batches appended to a growing table, with the constraints holding across all batches.
+
+        Keeps the stream state of the validator between validate calls: one uint64 hash per row for unique columns
+        and keys, the 'any' columns of ColumnNotNull that only had nulls so far, the value of single value columns
+        and the row count. Each batch is validated without the previous batches: it is hashed, looked up in the
+        sorted runs of hashes by binary search and added as a new run, see decorators._find_seen.
+
+        A batch that fails validation is not added to the state, so it can be fixed and validated again. Batches
+        are validated one at a time if several threads append to the same table.
+
+        :param ReturnValueDecorator validator: the constraints of the table.
+        """
+        self.validator = validator
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """ Forgets all batches, like for a truncated table. """
+        self._state = self.validator._new_state()
+
+    @property
+    def n_rows(self):
+        """ Number of rows of the accepted batches, None if the validator does not count rows. """
+        return self._state.get('n_rows', self._state.get('n_items'))
+
+    def validate(self, batch):
+        """ Validates a batch against the constraints and against the accepted batches, and accepts it.
+
+        Constraints that are only known for the whole table, like a not null 'any' column or a non-empty table,
+        are validated by finish.
+
+        :return: the batch.
+        """
+        with self._lock:
+            checkpoint = {key: copy(value) for key, value in self._state.items()}
+            try:
+                return self.validator._validate_stream_chunk(batch, self._state)
+            except BaseException:
+                self._state.update(checkpoint)
+                raise
+
+    def finish(self):
+        """ Validates the constraints on the whole table, like a not null 'any' column. The state is kept, so
+        batches can still be appended. """
+        with self._lock:
+            self.validator._finish_stream(self._state)
+
+    def __repr__(self):
+        return 'IncrementalValidator(%r, n_rows=%r)' % (self.validator, self.n_rows)
@@ -0,0 +1,108 @@
+from collections import Counter
+from threading import Lock
+from . import dask_backend, polars_backend
+import time
+
+# upper bounds of the latency buckets in seconds, the last bucket is open
+LATENCY_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1., 10.)
+
+_sinks = ()
+_sinks_lock = Lock()
+
+
+class Sink(object):
+    """ Receives one event per validation while it is registered. Subclasses override record. """
+
+    def record(self, validator, n_rows, seconds, error):
+        """ Called after each validation, in the validating thread.
+
+        :param ReturnValueDecorator validator: the validator, its stats are already updated.
+        :param int n_rows: length of the validated value, 0 if it has none or if it is lazy, like dask DataFrames
+            and polars LazyFrames, whose length would have to be computed.
+        :param float seconds: duration of the validation.
+        :param Exception error: the raised exception, None if the value passed.
+        """
+        pass
+
+
+class ValidatorStats(object):
+
+    def __init__(self):
+        """ Call count, failure count by exception class and latency histograms by frame size of a validator.
+
+        Frames are bucketed by the number of decimal digits of their length: bucket 0 holds empty frames and
+        values without length, bucket 3 frames of 100 to 999 rows. Each histogram counts the validations per
+        latency bucket, see LATENCY_BUCKETS. """
+        self.calls = 0
+        self.failures = Counter()
+        self.histograms = {}
+        self._lock = Lock()
+
+    def record(self, n_rows, seconds, error):
+        latency_bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound),
+                              len(LATENCY_BUCKETS))
+        size_bucket = len(str(n_rows)) if n_rows else 0
+        with self._lock:
+            self.calls += 1
+            if error is not None:
+                self.failures[type(error).__name__] += 1
+            if size_bucket not in self.histograms:
+                self.histograms[size_bucket] = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.histograms[size_bucket][latency_bucket] += 1
+
+    def __getstate__(self):
+        with self._lock:
+            return {'calls': self.calls, 'failures': Counter(self.failures),
+                    'histograms': {key: list(histogram) for key, histogram in self.histograms.items()}}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def __repr__(self):
+        return 'ValidatorStats(calls=%i, failures=%r)' % (self.calls, dict(self.failures))
+
+
+def register_sink(sink):
+    """ Starts recording validations. Stats are only recorded while at least one sink is registered, so that
+    validation does not pay for timing otherwise. """
+    global _sinks
+    with _sinks_lock:
+        if sink not in _sinks:
+            _sinks = _sinks + (sink,)
+
+
+def unregister_sink(sink):
+    global _sinks
+    with _sinks_lock:
+        _sinks = tuple(registered for registered in _sinks if registered is not sink)
+
+
+def _n_rows(value):
+    if dask_backend.is_dask(value) or polars_backend.is_lazy(value):
+        return 0
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+def measure(validator, fcn, value, *args):
+    """ Calls fcn(value, *args) and records its duration in validator.stats and in all registered sinks. """
+    error = None
+    start = time.perf_counter()
+    try:
+        return fcn(value, *args)
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        n_rows = _n_rows(value)
+        if validator.stats is None:
+            with _sinks_lock:
+                if validator.stats is None:
+                    validator.stats = ValidatorStats()
+        validator.stats.record(n_rows, seconds, error)
+        for sink in _sinks:
+            sink.record(validator, n_rows, seconds, error)
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+_default_workers = None
+_executors = {}
+_executors_lock = Lock()
+
+
+def set_default_workers(workers):
+    """ Sets the number of threads used by validators that were created without the workers option.
+
+    :param int workers: None or 1 to validate in the calling thread.
+    """
+    global _default_workers
+    if workers is not None and workers < 1:
+        raise ValueError('workers must be positive, got %r' % workers)
+    _default_workers = workers
+
+
+def get_default_workers():
+    return _default_workers
+
+
+def _get_executor(workers):
+    """ Thread pools are shared by all validators with the same number of workers and live as long as the process.
+    """
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = _executors[workers] = ThreadPoolExecutor(workers, thread_name_prefix='pd_typeguard')
+        return executor
+
+
+def map_ordered(fcn, items, workers=None):
+    """ Returns [fcn(item) for item in items], computed in a thread pool if more than one worker is requested.
+
+    The hashing, null and comparison kernels of pandas and numpy release the GIL, so columns are validated in
+    parallel. Results are returned in the order of items, and the exception of the first failing item in that order
+    is raised, so the outcome does not depend on thread scheduling.
+
+    :param int workers: number of threads, the default set by set_default_workers if None.
+    """
+    items = list(items)
+    if workers is None:
+        workers = _default_workers
+    if not workers or workers < 2 or len(items) < 2:
+        return [fcn(item) for item in items]
+    return list(_get_executor(workers).map(fcn, items))
@@ -0,0 +1,156 @@
+""" Validation of Parquet files and datasets from their footer statistics.
+
+The schema answers the column and dtype checks, the row counts of the row groups the length check. Not null and
+single value constraints are answered from the statistics of each column chunk: its null count, and its min and
+max, which are equal for a single value. A column chunk is only read if its statistics are missing or inexact. The
+constraints that statistics cannot answer, like uniqueness, are validated on a table of their columns only.
+
+Dtypes are those pd.read_parquet gives the columns, like int64 and object. Columns expected to have a pyarrow
+DataType or an ArrowDtype are compared with the ArrowDtype of the column instead, see arrow. Requires pyarrow.
+"""
+import pandas as pd
+from . import arrow
+from .exceptions import DFEmptyError, ColumnNullError, ColumnNotSingleValueError
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover
+    pc = ds = None
+
+
+def validate(validator, source, errors=None):
+    """ Validates a Parquet file or dataset.
+
+    :param HasColumn validator: provides the constraints with _parquet_constraints and _parquet_residual.
+    :param source: path of a file or directory, list of paths, or a pyarrow Dataset. Directories are read with hive
+        partitioning, like pd.read_parquet reads them.
+    :param list errors: collect violations instead of raising them.
+    """
+    if ds is None:
+        raise ImportError('Parquet validation requires pyarrow')
+    dataset = source if isinstance(source, ds.Dataset) else ds.dataset(source, format='parquet', partitioning='hive')
+    frame = _schema_frame(dataset.schema, getattr(validator, 'dtypes', {}))
+    if not validator._validate_has_columns(frame, errors):
+        return
+    validator._validate_details(frame, True, errors=errors)
+    notnull, single_value = validator._parquet_constraints()
+    statistics = _ColumnStatistics(list(notnull), list(single_value))
+    for fragment in dataset.get_fragments():
+        statistics.add_fragment(fragment)
+    if not statistics.n_rows:
+        if not validator.allow_empty:
+            validator._fail(DFEmptyError('Parquet source has no rows.'), errors)
+        return
+    wrong_content = {column: statistics.nulls[column] for column, expected in notnull.items()
+                     if (expected == 'all' and statistics.nulls[column])
+                     or (expected == 'any' and statistics.nulls[column] == statistics.n_rows)}
+    if wrong_content:
+        validator._fail(ColumnNullError(null_counts=wrong_content, expected=notnull, n_rows=statistics.n_rows),
+                        errors)
+    for column in single_value:
+        if len(statistics.values[column]) > 1:
+            validator._fail(ColumnNotSingleValueError(column=column, values=statistics.values[column][:2]), errors)
+    residual = validator._parquet_residual()
+    if residual is not None:
+        table = dataset.to_table(columns=residual._column_order)
+        if errors is None:
+            residual.validate(table)
+        else:
+            errors.extend(residual.validate(table, mode='report'))
+
+
+def _schema_frame(schema, dtypes):
+    """ Empty DataFrame with the dtypes pd.read_parquet gives the columns of a schema, and ArrowDtypes for the
+    columns that are expected to have one.
+
+    :param dict dtypes: expected dtypes of the validator.
+    """
+    table = schema.empty_table()
+    frame = table.to_pandas()
+    arrow_columns = [column for column, dtype in dtypes.items()
+                     if column in frame and isinstance(arrow.normalize_dtype(dtype), pd.ArrowDtype)]
+    if arrow_columns:
+        arrow_frame = arrow.as_frame(table.select(arrow_columns))
+        for column in arrow_columns:
+            frame[column] = arrow_frame[column].array
+    return frame
+
+
+class _ColumnStatistics(object):
+
+    def __init__(self, notnull, single_value):
+        """ Null counts and distinct values of columns, accumulated over row groups.
+
+        :param list notnull: columns to count the nulls of.
+        :param list single_value: columns to collect up to two distinct values of.
+        """
+        self.notnull = notnull
+        self.single_value = single_value
+        self.n_rows = 0
+        self.nulls = {column: 0 for column in notnull}
+        self.values = {column: [] for column in single_value}
+
+    def add_fragment(self, fragment):
+        """ Accumulates the row groups of a file. Columns that are not in the file, like hive partition columns, have
+        the value of the partition expression of the file in all rows, or null. """
+        metadata = fragment.metadata
+        positions = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+        constants = ds.get_partition_keys(fragment.partition_expression)
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            self.n_rows += row_group.num_rows
+            unread_nulls, unread_values = [], []
+            for column in self.notnull:
+                if column not in positions:
+                    if constants.get(column) is None:
+                        self.nulls[column] += row_group.num_rows
+                    continue
+                chunk_statistics = row_group.column(positions[column]).statistics
+                if chunk_statistics is not None and chunk_statistics.has_null_count:
+                    self.nulls[column] += chunk_statistics.null_count
+                else:
+                    unread_nulls.append(column)
+            for column in self.single_value:
+                if column not in positions:
+                    if constants.get(column) is not None:
+                        self._add_values(column, constants[column], constants[column])
+                    continue
+                chunk_statistics = row_group.column(positions[column]).statistics
+                if chunk_statistics is None or not chunk_statistics.has_null_count:
+                    unread_values.append(column)
+                elif chunk_statistics.null_count == row_group.num_rows:
+                    continue
+                elif chunk_statistics.has_min_max and _is_exact(chunk_statistics):
+                    self._add_values(column, chunk_statistics.min, chunk_statistics.max)
+                else:
+                    unread_values.append(column)
+            if unread_nulls or unread_values:
+                columns = list(dict.fromkeys(unread_nulls + unread_values))
+                self._read(_read_row_group(fragment, i, columns), unread_nulls, unread_values)
+
+    def _read(self, table, null_columns, value_columns):
+        """ Accumulates the columns of a row group that has no usable statistics for them. """
+        for column in null_columns:
+            self.nulls[column] += table.column(column).null_count
+        for column in value_columns:
+            array = table.column(column)
+            if array.null_count < len(array):
+                min_max = pc.min_max(array)
+                self._add_values(column, min_max['min'].as_py(), min_max['max'].as_py())
+
+    def _add_values(self, column, minimum, maximum):
+        values = self.values[column]
+        for value in (minimum, maximum):
+            if len(values) < 2 and value not in values:
+                values.append(value)
+
+
+def _read_row_group(fragment, row_group, columns):
+    return fragment.subset(row_group_ids=[row_group]).to_table(columns=columns)
+
+
+def _is_exact(chunk_statistics):
+    """ Min and max may be truncated for long strings, if the writer says so. """
+    return getattr(chunk_statistics, 'is_min_value_exact', None) is not False \
+        and getattr(chunk_statistics, 'is_max_value_exact', None) is not False
@@ -0,0 +1,154 @@
+""" Validation of polars DataFrames and LazyFrames with polars expressions.
+
+Columns and dtypes are validated on the schema. The content checks of a validator are polars expressions that
+reduce a column to a scalar (null count, number of distinct values, first two distinct values); they are
+evaluated in a single select, so polars runs them in parallel in one pass over the frame. For a LazyFrame, the
+content checks are added to the query plan with map_batches and run when the frame is collected, without
+optimizations being pushed through them.
+
+Nulls are polars nulls: NaN is a value in polars. The sample option does not apply to polars frames.
+"""
+from functools import lru_cache, partial
+from .arrow import normalize_dtype
+from .exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError,
+                         ColumnNotSingleValueError)
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None
+
+
+def is_polars(value):
+    return pl is not None and isinstance(value, (pl.DataFrame, pl.LazyFrame))
+
+
+def is_lazy(value):
+    return pl is not None and isinstance(value, pl.LazyFrame)
+
+
+def to_arrow(value):
+    """ pyarrow Table sharing the buffers of a polars DataFrame, any other value unchanged. """
+    if pl is not None and isinstance(value, pl.DataFrame):
+        return value.to_arrow()
+    return value
+
+
+def validate(validator, value, errors=None):
+    """ Validates a polars DataFrame, or returns a LazyFrame that validates its result when it is collected.
+
+    :param HasColumn validator: provides the content checks with _polars_checks.
+    :param list errors: collect violations instead of raising them. Content violations of a LazyFrame are raised
+        on collection in any case.
+    """
+    schema = value.collect_schema() if isinstance(value, pl.LazyFrame) else value.schema
+    missing = [column for column in validator._column_order if column not in schema]
+    if missing:
+        validator._fail(MissingColumnError(columns=missing), errors)
+        return value
+    validator._validate_polars_schema(schema, errors)
+    if isinstance(value, pl.LazyFrame):
+        return value.map_batches(partial(validate_frame, validator))
+    validate_frame(validator, value, errors)
+    return value
+
+
+def validate_length(frame):
+    """ Returns a LazyFrame that raises DFEmptyError when it is collected without rows, see NotEmpty. """
+    return frame.map_batches(_not_empty)
+
+
+def _not_empty(frame):
+    if not frame.height:
+        raise DFEmptyError('value is empty %s' % type(frame))
+    return frame
+
+
+def validate_frame(validator, frame, errors=None):
+    """ Validates the length and the content of a polars DataFrame, with all checks in one select. """
+    if not frame.height:
+        if not validator.allow_empty:
+            validator._fail(DFEmptyError('Return value of type %s has length 0.' % type(frame)), errors)
+        return frame
+    checks = validator._polars_checks()
+    expressions = [expression.alias('%i_%i' % (i, j))
+                   for i, (check_expressions, _) in enumerate(checks)
+                   for j, expression in enumerate(check_expressions)]
+    results = frame.select(expressions).row(0) if expressions else ()
+    start = 0
+    for check_expressions, check in checks:
+        check(frame, results[start:start + len(check_expressions)], errors)
+        start += len(check_expressions)
+    return frame
+
+
+def _column_data(frame, column):
+    """ Converts a column to pandas when the diagnostics of an exception are read. """
+    return lambda: frame.get_column(column).to_pandas()
+
+
+def _columns_data(frame, columns):
+    return lambda: frame.select(list(columns)).to_pandas()
+
+
+@lru_cache(maxsize=None)
+def _pandas_dtypes(dtype):
+    """ The dtypes a polars dtype becomes in pandas, NumPy-backed and Arrow-backed. """
+    series = pl.Series(dtype=dtype)
+    return series.to_pandas().dtype, series.to_pandas(use_pyarrow_extension_array=True).dtype
+
+
+def _is_dtype(actual, expected):
+    """ Compares a polars dtype with an expected dtype. Polars dtypes are compared as they are, other specs with
+    the dtypes of the column in pandas: 'int64', np.int64, 'Int64' and pa.int64() match Int64, 'category' matches
+    Categorical and Enum. """
+    if isinstance(expected, pl.DataType) or isinstance(expected, type) and issubclass(expected, pl.DataType):
+        return actual == expected
+    numpy_dtype, arrow_dtype = _pandas_dtypes(actual)
+    expected = normalize_dtype(expected)
+    return numpy_dtype == expected or arrow_dtype == expected \
+        or getattr(expected, 'numpy_dtype', None) == numpy_dtype and numpy_dtype != object
+
+
+def dtype_error(dtypes, schema):
+    """ WrongDtypeError for the columns of the schema that differ from dtypes, None if there are none. """
+    wrong_dtypes = {column: (schema[column], dtype) for column, dtype in dtypes.items()
+                    if not _is_dtype(schema[column], dtype)}
+    return WrongDtypeError(dtypes=wrong_dtypes) if wrong_dtypes else None
+
+
+def notnull_check(validator, notnull):
+    """ Check of not null constraints, see ColumnNotNull. """
+    columns = list(notnull)
+
+    def check(frame, null_counts, errors):
+        wrong_content = {column: n_null for column, n_null in zip(columns, null_counts)
+                         if (notnull[column] == 'all' and n_null)
+                         or (notnull[column] == 'any' and n_null == frame.height)}
+        if wrong_content:
+            validator._fail(ColumnNullError(null_counts=wrong_content, expected=notnull, n_rows=frame.height,
+                                            data=_columns_data(frame, wrong_content)), errors)
+
+    return [pl.col(column).null_count() for column in columns], check
+
+
+def unique_check(validator, column, is_key):
+    """ Check of a unique column or composite key, by its number of distinct values. Nulls are equal. """
+
+    def check(frame, n_unique, errors):
+        if n_unique[0] < frame.height:
+            data = _columns_data(frame, column) if is_key else _column_data(frame, column)
+            validator._fail(ColumnNotUniqueError(column=column, is_key=is_key, data=data), errors)
+
+    return [pl.struct(list(column)).n_unique() if is_key else pl.col(column).n_unique()], check
+
+
+def single_value_check(validator, column):
+    """ Check of a single value column, by its first two distinct non-null values. """
+
+    def check(frame, first_values, errors):
+        if len(first_values[0]) > 1:
+            validator._fail(ColumnNotSingleValueError(column=column, values=first_values[0],
+                                                      data=_column_data(frame, column)), errors)
+
+    return [pl.col(column).drop_nulls().unique(maintain_order=True).head(2).implode()], check
@@ -0,0 +1,43 @@
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100000
+
+
+def read_csv(filepath_or_buffer, validator, chunksize=DEFAULT_CHUNKSIZE, iterator=False, **kwargs):
+    """ pd.read_csv that validates the file while it is parsed, and stops at the first violation.
+
+    The header is parsed first and validated against the columns of the validator, so a file without the required
+    columns is rejected before any data is parsed. The data is then parsed in chunks, and each chunk is validated
+    before the next one is parsed, with the constraints on the whole file validated across chunks like in
+    validate_stream.
+
+    dtypes are inferred per chunk, so a column may get different dtypes in different chunks. Pass the dtype
+    argument for columns with declared dtypes.
+
+    :param filepath_or_buffer: like pd.read_csv. A buffer must be seekable, to parse the header twice.
+    :param HasColumn validator: the constraints of the file.
+    :param int chunksize: number of rows parsed and validated at a time.
+    :param bool iterator: return an iterator of validated chunks instead of a DataFrame.
+    :param kwargs: arguments of pd.read_csv.
+    """
+    start = None
+    if hasattr(filepath_or_buffer, 'read'):
+        if not getattr(filepath_or_buffer, 'seekable', lambda: hasattr(filepath_or_buffer, 'seek'))():
+            raise ValueError('read_csv parses the header twice and needs a seekable buffer, got %r'
+                             % filepath_or_buffer)
+        start = filepath_or_buffer.tell()
+    header = pd.read_csv(filepath_or_buffer, **dict(kwargs, nrows=0))
+    validator._validate_has_columns(header)
+    if start is not None:
+        filepath_or_buffer.seek(start)
+    chunks = _read_chunks(filepath_or_buffer, validator, chunksize, kwargs)
+    if iterator:
+        return chunks
+    chunks = list(chunks)
+    return pd.concat(chunks) if chunks else header
+
+
+def _read_chunks(filepath_or_buffer, validator, chunksize, kwargs):
+    with pd.read_csv(filepath_or_buffer, chunksize=chunksize, **kwargs) as reader:
+        for chunk in validator.validate_stream(reader):
+            yield chunk
@@ -0,0 +1,38 @@
+from .exceptions import ValidationReportError
+
+
+class ValidationReport(object):
+
+    def __init__(self, validator, errors):
+        """ All constraints a value violates, returned by validate(value, mode='report').
+
+        :param ReturnValueDecorator validator: the validator that created the report.
+        :param list errors: one ReturnValueError per violated constraint, in the order of validation.
+        """
+        self.validator = validator
+        self.errors = list(errors)
+
+    @property
+    def ok(self):
+        """ True if the value passed all constraints. """
+        return not self.errors
+
+    def raise_if_failed(self):
+        """ Raises a single ValidationReportError listing all violations, if there are any. """
+        if self.errors:
+            raise ValidationReportError(self)
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    def __str__(self):
+        if not self.errors:
+            return '%s: no violations' % type(self.validator).__name__
+        return '%s: %i violations\n' % (type(self.validator).__name__, len(self.errors)) + '\n'.join(
+            '- %s: %s' % (type(error).__name__, error) for error in self.errors)
+
+    def __repr__(self):
+        return '<ValidationReport %s>' % ', '.join(type(error).__name__ for error in self.errors)
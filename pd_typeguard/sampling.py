@@ -0,0 +1,101 @@
+from collections import namedtuple
+import numpy as np
+
+
+class SampleGuarantee(namedtuple('SampleGuarantee', ['n_rows', 'n_sampled', 'confidence', 'min_violation_rate',
+                                                     'pair_detection_probability'])):
+    """ Statistical guarantee of a sampled validation.
+
+    A constraint that is violated in at least `min_violation_rate` of all rows (nulls, a second value) is detected
+    with probability `confidence`. A single pair of duplicate rows is only detected with probability
+    `pair_detection_probability`, so sampling is weak evidence for uniqueness. """
+
+    def __str__(self):
+        if self.n_sampled >= self.n_rows:
+            return 'all %i rows validated' % self.n_rows
+        return ('%i of %i rows validated: violations in at least %.4g%% of the rows are detected with %.4g%% '
+                'confidence, a single duplicate pair with %.4g%% probability' % (
+                    self.n_sampled, self.n_rows, 100 * self.min_violation_rate, 100 * self.confidence,
+                    100 * self.pair_detection_probability))
+
+
+class Sample(object):
+
+    def __init__(self, fraction=None, n=None, chunks=None, random_state=None):
+        """ Policy to validate a subset of the rows of a DataFrame.
+
+        :param float fraction: share of rows to validate, in (0, 1].
+        :param int n: number of rows to validate.
+        :param int chunks: stratify by chunk: split the rows into this many contiguous chunks of equal length and
+            sample from each of them, so that every region of the frame is covered.
+        :param int random_state: seed for a deterministic sample, the same rows are drawn on every call for frames of
+            the same length. A new random sample is drawn on every call if None.
+        """
+        if (fraction is None) == (n is None):
+            raise ValueError('exactly one of fraction and n must be given')
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError('fraction must be in (0, 1], got %r' % fraction)
+        if n is not None and n < 1:
+            raise ValueError('n must be positive, got %r' % n)
+        if chunks is not None and chunks < 1:
+            raise ValueError('chunks must be positive, got %r' % chunks)
+        self.fraction = fraction
+        self.n = n
+        self.chunks = chunks
+        self.random_state = random_state
+
+    @classmethod
+    def from_spec(cls, spec):
+        """ Creates a policy from a Sample, a float fraction or an int row count. """
+        if spec is None or isinstance(spec, Sample):
+            return spec
+        if isinstance(spec, float):
+            return cls(fraction=spec)
+        if isinstance(spec, int) and not isinstance(spec, bool):
+            return cls(n=spec)
+        raise TypeError('sample must be a Sample, a float fraction or an int row count, got %r' % (spec,))
+
+    def size(self, n_rows):
+        """ Number of rows validated for a frame of length n_rows. """
+        if self.fraction is not None:
+            size = int(np.ceil(self.fraction * n_rows))
+        else:
+            size = self.n
+        return max(min(size, n_rows), min(1, n_rows))
+
+    def positions(self, n_rows):
+        """ Sorted row positions to validate. """
+        size = self.size(n_rows)
+        rng = np.random.default_rng(self.random_state)
+        if size >= n_rows:
+            return np.arange(n_rows)
+        if not self.chunks:
+            return np.sort(rng.choice(n_rows, size, replace=False))
+        bounds = np.linspace(0, n_rows, min(self.chunks, size) + 1).astype(np.int64)
+        sizes = np.minimum(np.diff(np.linspace(0, size, len(bounds)).astype(np.int64)), np.diff(bounds))
+        return np.concatenate([start + np.sort(rng.choice(stop - start, n_chunk, replace=False))
+                               for start, stop, n_chunk in zip(bounds[:-1], bounds[1:], sizes)])
+
+    def draw(self, value):
+        """ Returns the rows of value to validate. The frame itself is not modified. """
+        n_rows = len(value)
+        if self.size(n_rows) >= n_rows:
+            return value
+        return value.take(self.positions(n_rows))
+
+    def guarantee(self, n_rows, confidence=0.95):
+        """ Statistical guarantee of validating a frame of length n_rows with this policy.
+
+        :rtype: SampleGuarantee
+        """
+        n_sampled = self.size(n_rows)
+        if n_sampled >= n_rows:
+            return SampleGuarantee(n_rows, n_rows, 1., 0., 1.)
+        # sampling without replacement detects at least as often as the binomial bound
+        min_violation_rate = 1 - (1 - confidence) ** (1. / n_sampled)
+        share = n_sampled / float(n_rows)
+        return SampleGuarantee(n_rows, n_sampled, confidence, min_violation_rate, share * share)
+
+    def __repr__(self):
+        return 'Sample(fraction=%r, n=%r, chunks=%r, random_state=%r)' % (
+            self.fraction, self.n, self.chunks, self.random_state)
@@ -0,0 +1,213 @@
+from functools import partial
+from threading import Lock
+import time
+from .decorators import (HasColumn, _null_count, _scan_single_value, _find_duplicates, _find_seen, _not_unique_error,
+                         _merge_hashes, _merge_first, _raise_all_null, _validate_notnull_sample, _normalize_dtypes,
+                         _NO_HASHES, _NO_VALUE)
+from .parallel import map_ordered
+from . import polars_backend
+from .exceptions import WrongDtypeError, ColumnNullError, ColumnNotSingleValueError
+
+# prior cost of the data checks in seconds per row: null counts are often read from metadata, single values are
+# scanned up to the first other value, unique columns and keys hash every row
+PRIOR_COSTS = {'_check_notnull': 1e-9, '_check_single_value': 3e-9, '_check_unique': 3e-8, '_check_key': 1e-7}
+PRIOR_ROWS = 10000  # weight of the prior cost, in rows
+
+
+class _CheckProfile(object):
+
+    def __init__(self):
+        """ Runs, failures, rows and seconds of each data check of a Schema, keyed by column and check name. """
+        self._stats = {}
+        self._lock = Lock()
+
+    def record(self, key, n_rows, seconds, failed):
+        with self._lock:
+            stats = self._stats.setdefault(key, [0, 0, 0, 0.])
+            stats[0] += 1
+            stats[1] += failed
+            stats[2] += n_rows
+            stats[3] += seconds
+
+    def rank(self, key):
+        """ Expected cost per row of a check until it finds a violation: its cost per row over its failure rate.
+        Both are smoothed by the prior of the check, so that checks without records run in the order of the prior
+        costs. """
+        runs, failures, rows, seconds = self._stats.get(key, (0, 0, 0, 0.))
+        cost = (seconds + PRIOR_COSTS[key[1]] * PRIOR_ROWS) / (rows + PRIOR_ROWS)
+        return cost * (runs + 2) / (failures + 1)
+
+    def order(self, checks):
+        """ Sorts checks (column, check, is_key) by rank, keeping the order of declaration for equal ranks. """
+        return sorted(checks, key=lambda check: self.rank((check[0], check[1].__name__)))
+
+    def __getstate__(self):
+        with self._lock:
+            return {'_stats': {key: list(stats) for key, stats in self._stats.items()}}
+
+    def __setstate__(self, state):
+        self._stats = state['_stats']
+        self._lock = Lock()
+
+
+class Schema(HasColumn):
+
+    def __init__(self, dtypes=None, notnull=None, unique=None, single_value=None, allow_none=False,
+                 allow_empty=False, keys=None, sample=None, **kwargs):
+        """ Validates all column constraints of a DataFrame at once.
+
+        Replaces stacked HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique and ColumnSingleValue decorators.
+        The None check, the column check, the length check and the dtype check are done only once, before the data
+        checks. The data checks run the cheapest first: null counts, single values, unique columns, keys. Each
+        Schema records the failure rate and the cost per row of its checks and reorders them, so that a frame that
+        violates a constraint is rejected after the least expected work. In report mode, all checks run in the
+        order of declaration.
+
+        :param dict dtypes: pairs column name with expected dtype. Polars columns also match the pandas dtype they
+            convert to, see polars_backend.
+        :param dict notnull: pairs column name with 'all' or 'any', see ColumnNotNull.
+        :param iterable unique: columns that must not contain duplicates.
+        :param iterable single_value: columns that must not contain more than one distinct value.
+        :param bool allow_none: make None a valid return value.
+        :param bool allow_empty: allow a DataFrame of length zero, if it has the required columns
+        :param iterable keys: groups of columns that must be unique in combination, see ColumnUnique.
+        :param sample: see HasColumn and ColumnNotNull.
+        :param kwargs: options of ReturnValueDecorator.
+        """
+        self.dtypes = dict(dtypes or {})
+        self.notnull = dict(notnull or {})
+        self.unique = list(unique or [])
+        self.single_value = list(single_value or [])
+        self.keys = [tuple(key) for key in (keys or [])]
+        self._plan = self._compile()
+        self._checks = [(column, check, False) for column, checks in self._plan.items() for check in checks] + \
+            [(key, self._check_key, True) for key in self.keys]
+        self._profile = _CheckProfile()
+        super(Schema, self).__init__(self._plan, allow_none=allow_none, allow_empty=allow_empty, sample=sample,
+                                     **kwargs)
+        self._dtype_plan = _normalize_dtypes(self.dtypes, self._column_names)
+
+    def _compile(self):
+        """ Groups the data checks by column, keeping the order of declaration. """
+        plan = {}
+        for column, notnull in self.notnull.items():
+            if notnull not in ('all', 'any'):
+                raise ValueError('not null constraint for column %s must be "all" or "any", got %r' % (
+                    column, notnull))
+            plan.setdefault(column, []).append(self._check_notnull)
+        for column in self.unique:
+            plan.setdefault(column, []).append(self._check_unique)
+        for column in self.single_value:
+            plan.setdefault(column, []).append(self._check_single_value)
+        for column in self.dtypes:
+            plan.setdefault(column, [])
+        for column in (col for key in self.keys for col in key):
+            plan.setdefault(column, [])
+        return plan
+
+    def _validate_sample(self, value, errors=None):
+        _validate_notnull_sample(self, value, errors)
+
+    def _new_state(self):
+        state = super(Schema, self)._new_state()
+        state['all_null'] = {column for column, notnull in self.notnull.items() if notnull == 'any'}
+        state['hashes'] = {col: _NO_HASHES for col in self.unique}
+        state['key_hashes'] = {key: _NO_HASHES for key in self.keys}
+        state['first'] = {}
+        return state
+
+    def _merge_states(self, state, other):
+        merged = super(Schema, self)._merge_states(state, other)
+        merged['all_null'] = state['all_null'] & other['all_null']
+        merged['hashes'] = {col: _merge_hashes(col, False, state['hashes'][col], other['hashes'][col])
+                            for col in self.unique}
+        merged['key_hashes'] = {key: _merge_hashes(key, True, state['key_hashes'][key], other['key_hashes'][key])
+                                for key in self.keys}
+        merged['first'] = _merge_first(state['first'], other['first'])
+        return merged
+
+    def _finish_stream(self, state):
+        super(Schema, self)._finish_stream(state)
+        _raise_all_null(state, self.notnull)
+
+    def _validate_details(self, value, is_empty, state=None, errors=None):
+        layout = self._layout(value)
+        if layout.wrong_dtypes:
+            self._fail(WrongDtypeError(dtypes=dict(layout.wrong_dtypes)), errors)
+        if is_empty:
+            return
+        checks = self._checks if errors is not None else self._profile.order(self._checks)
+        for check_errors in map_ordered(partial(self._run_check, layout, value, state, errors), checks,
+                                        self.workers):
+            if check_errors:
+                errors.extend(check_errors)
+
+    def _validate_polars_schema(self, schema, errors=None):
+        error = polars_backend.dtype_error(self.dtypes, schema)
+        if error is not None:
+            self._fail(error, errors)
+
+    def _polars_checks(self):
+        builders = {
+            self._check_notnull: lambda column: polars_backend.notnull_check(self, {column: self.notnull[column]}),
+            self._check_unique: lambda column: polars_backend.unique_check(self, column, False),
+            self._check_single_value: lambda column: polars_backend.single_value_check(self, column),
+        }
+        return [builders[check](column) for column, checks in self._plan.items() for check in checks] + \
+            [polars_backend.unique_check(self, key, True) for key in self.keys]
+
+    def _parquet_constraints(self):
+        return self.notnull, self.single_value
+
+    def _parquet_residual(self):
+        if not self.unique and not self.keys:
+            return None
+        return Schema(unique=self.unique, keys=self.keys, allow_empty=True, workers=self.workers)
+
+    def _run_check(self, layout, value, state, errors, item):
+        """ Runs a data check and records it in the profile. """
+        column, check, is_key = item
+        data = layout.columns_of(value, column) if is_key else layout.column(value, column)
+        check_errors = [] if errors is not None else None
+        failed = True
+        start = time.perf_counter()
+        try:
+            check(column, data, state, check_errors)
+            failed = bool(check_errors)
+        finally:
+            self._profile.record((column, check.__name__), len(data), time.perf_counter() - start, failed)
+        return check_errors
+
+    def _check_key(self, key, data, state, errors):
+        duplicates = _find_duplicates(data)
+        if duplicates is None and state is not None:
+            duplicates = _find_seen(data, state['key_hashes'], key)
+        if duplicates is not None:
+            self._fail(_not_unique_error(key, True, duplicates), errors)
+        return errors
+
+    def _check_notnull(self, column, series, state, errors):
+        n_null = _null_count(series)
+        if n_null == 0:
+            if state is not None:
+                state['all_null'].discard(column)
+            return
+        if self.notnull[column] == 'all' or (n_null == len(series) and state is None):
+            self._fail(ColumnNullError(null_counts={column: n_null}, expected={column: self.notnull[column]},
+                                       n_rows=len(series), data={column: series}), errors)
+        if state is not None and n_null < len(series):
+            state['all_null'].discard(column)
+
+    def _check_unique(self, column, series, state, errors):
+        duplicates = _find_duplicates(series)
+        if duplicates is None and state is not None:
+            duplicates = _find_seen(series, state['hashes'], column)
+        if duplicates is not None:
+            self._fail(_not_unique_error(column, False, duplicates), errors)
+
+    def _check_single_value(self, column, series, state, errors):
+        first, other = _scan_single_value(series, _NO_VALUE if state is None else state['first'].get(column, _NO_VALUE))
+        if other is not _NO_VALUE:
+            self._fail(ColumnNotSingleValueError(column=column, values=(first, other), data=series), errors)
+        if state is not None and first is not _NO_VALUE:
+            state['first'][column] = first
@@ -0,0 +1,82 @@
+from unittest import TestCase, mock, skipIf
+from ..decorators import (NotEmpty, HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue,
+                          _null_count)
+from ..schema import Schema
+from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError,
+                          ColumnNotSingleValueError)
+from .. import arrow
+
+import pandas as pd
+
+pa = arrow.pa
+
+
+@skipIf(pa is None, 'pyarrow is not installed')
+class TestArrow(TestCase):
+
+    def setUp(self):
+        self.table = pa.table({'a': [1, 2, 3], 'b': [1., None, None], 'c': ['x', 'x', None], 'd': ['x', 'y', 'x']})
+
+    def test_table(self):
+        self.assertIs(self.table, NotEmpty().validate(self.table))
+        self.assertIs(self.table, HasColumn(['a', 'b']).validate(self.table))
+        self.assertRaises(MissingColumnError, HasColumn(['e']).validate, self.table)
+        self.assertRaises(DFEmptyError, HasColumn(['a']).validate, self.table.slice(0, 0))
+        batch = self.table.to_batches()[0]
+        self.assertIs(batch, HasColumn(['a']).validate(batch))
+
+    def test_frame_shares_buffers(self):
+        frame = arrow.as_frame(self.table)
+        self.assertIsInstance(frame['a'].dtype, pd.ArrowDtype)
+        self.assertEqual(self.table['a'].chunk(0).buffers()[1].address,
+                         frame['a'].array.__arrow_array__().chunk(0).buffers()[1].address)
+
+    def test_dtype(self):
+        ColumnHasDtype({'a': pa.int64(), 'c': pa.string()}).validate(self.table)
+        ColumnHasDtype({'a': 'int64[pyarrow]'}).validate(self.table)
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': pa.int32()}).validate, self.table)
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': pa.int64()}).validate, pd.DataFrame({'a': [1]}))
+        self.assertRaises(WrongDtypeError, Schema(dtypes={'a': pa.float64()}).validate, self.table)
+
+    def test_not_null(self):
+        """ Null counts are read from the metadata of the arrays. """
+        ColumnNotNull({'a': 'all', 'b': 'any'}).validate(self.table)
+        self.assertRaises(ColumnNullError, ColumnNotNull({'c': 'all'}).validate, self.table)
+        with self.assertRaises(ColumnNullError) as context:
+            Schema(notnull={'b': 'all'}).validate(self.table)
+        self.assertEqual({'b': 2}, context.exception.null_counts)
+        self.assertEqual({'b': [1, 2]}, context.exception.positions)
+        series = arrow.as_frame(self.table)['b']
+        with mock.patch.object(pd.Series, 'count', side_effect=AssertionError):
+            self.assertEqual(2, _null_count(series))
+
+    def test_unique(self):
+        ColumnUnique(['a'], keys=[('c', 'd')]).validate(self.table)
+        Schema(unique=['a'], keys=[('c', 'd')]).validate(self.table)
+        with self.assertRaises(ColumnNotUniqueError) as context:
+            ColumnUnique(['d']).validate(self.table)
+        self.assertEqual([2], context.exception.positions)
+        self.assertEqual(['x'], context.exception.values)
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique(['b']).validate, self.table)
+        ColumnUnique([], keys=[('b', 'c')]).validate(self.table)
+        null_rows = pa.table({'b': pa.array([None, None], pa.float64()), 'c': ['x', 'x']})
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique([], keys=[('b', 'c')]).validate, null_rows)
+        self.assertRaises(ColumnNotUniqueError, Schema(keys=[('a', 'd')]).validate,
+                          pa.table({'a': [1, 1], 'd': ['x', 'x']}))
+
+    def test_single_value(self):
+        ColumnSingleValue(['c']).validate(self.table)
+        ColumnSingleValue(['b']).validate(self.table)
+        with self.assertRaises(ColumnNotSingleValueError) as context:
+            Schema(single_value=['d']).validate(self.table)
+        self.assertEqual(('x', 'y'), context.exception.values)
+        dictionary = pa.table({'a': pa.array(['x', None, 'x']).dictionary_encode()})
+        ColumnSingleValue(['a']).validate(dictionary)
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['a']).validate,
+                          pa.table({'a': pa.array(['x', 'y']).dictionary_encode()}))
+
+    def test_stream(self):
+        validator = Schema(unique=['a'], single_value=['c'], notnull={'b': 'any'})
+        batches = self.table.to_batches(max_chunksize=1)
+        self.assertEqual(3, len(list(validator.validate_stream(iter(batches)))))
+        self.assertRaises(ColumnNotUniqueError, list, validator.validate_stream(iter(batches + batches)))
@@ -0,0 +1,108 @@
+from unittest import TestCase
+from ..cache import ValidationCache
+from ..decorators import HasColumn, ColumnUnique
+from ..exceptions import ColumnNotUniqueError
+from .. import dask_backend, polars_backend
+
+import gc
+import pickle
+import pandas as pd
+
+
+class CountingUnique(ColumnUnique):
+
+    n_validated = 0
+
+    def validate(self, value):
+        CountingUnique.n_validated += 1
+        return super(CountingUnique, self).validate(value)
+
+
+class TestValidationCache(TestCase):
+
+    def setUp(self):
+        CountingUnique.n_validated = 0
+
+    def test_cache(self):
+        cache = ValidationCache(maxsize=2)
+        df = pd.DataFrame({'a': [1, 2]})
+        self.assertNotIn((df, 'sig'), cache)
+        cache.add(df, 'sig')
+        self.assertIn((df, 'sig'), cache)
+        self.assertNotIn((df, 'other'), cache)
+        df['b'] = 1
+        self.assertNotIn((df, 'sig'), cache)
+        cache.add(None, 'sig')
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(ValueError, ValidationCache, 0)
+
+    def test_pickle(self):
+        cache = ValidationCache(maxsize=2)
+        df = pd.DataFrame({'a': [1, 2]})
+        cache.add(df, 'sig')
+        copied = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((2, 0), (copied.maxsize, len(copied)))
+        copied.add(df, 'sig')
+        self.assertIn((df, 'sig'), copied)
+
+    def test_eviction(self):
+        cache = ValidationCache(maxsize=2)
+        frames = [pd.DataFrame({'a': [i]}) for i in range(3)]
+        for df in frames:
+            cache.add(df, 'sig')
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn((frames[0], 'sig'), cache)
+        self.assertIn((frames[2], 'sig'), cache)
+        del frames, df
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+
+    def test_decorator(self):
+        cache = ValidationCache()
+        df = pd.DataFrame({'a': [1, 2]})
+
+        @CountingUnique(['a'], cache=cache)
+        def first(value):
+            return value
+
+        @CountingUnique(['a'], cache=cache)
+        def second(value):
+            return value
+
+        self.assertIs(df, first(df))
+        self.assertIs(df, second(df))
+        self.assertIs(df, first(df))
+        self.assertEqual(1, CountingUnique.n_validated)
+        self.assertIs(df, CountingUnique(['a'], keys=[('a',)], cache=cache)(first)(df))
+        self.assertEqual(2, CountingUnique.n_validated)
+        df_invalid = pd.DataFrame({'a': [1, 1]})
+        self.assertRaises(ColumnNotUniqueError, first, df_invalid)
+        self.assertRaises(ColumnNotUniqueError, first, df_invalid)
+        self.assertEqual(4, CountingUnique.n_validated)
+        self.assertRaises(TypeError, HasColumn, ['a'], cache='yes')
+
+    def test_reassigned_column(self):
+        cache = ValidationCache()
+        df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]})
+        validator = ColumnUnique(['a'], cache=cache)
+        mirror = validator(lambda value: value)
+        self.assertIs(df, mirror(df))
+        self.assertIn((df, validator.signature), cache)
+        df['a'] = 1
+        self.assertRaises(ColumnNotUniqueError, mirror, df)
+
+    def test_lazy(self):
+        """ Lazy frames are validated on every call, the returned frame carries their content checks. """
+        cache = ValidationCache()
+        frames = []
+        if dask_backend.dd is not None:
+            frames.append(dask_backend.dd.from_pandas(pd.DataFrame({'a': [1, 1]}), npartitions=1))
+        if polars_backend.pl is not None:
+            frames.append(polars_backend.pl.LazyFrame({'a': [1, 1]}))
+        for frame in frames:
+            mirror = ColumnUnique(['a'], cache=cache)(lambda value: value)
+            for _ in range(2):
+                validated = mirror(frame)
+                self.assertIsNot(frame, validated)
+                self.assertRaises(ColumnNotUniqueError, getattr(validated, 'compute', None) or validated.collect)
+        self.assertEqual(0, len(cache))
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from .. import config
+from ..decorators import NotEmpty, HasColumn
+from ..exceptions import DFEmptyError
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+
+
+class TestConfig(TestCase):
+
+    def tearDown(self):
+        config.set_enabled(True)
+
+    def test_disabled_scope(self):
+
+        @NotEmpty()
+        def mirror(value):
+            return value
+
+        @NotEmpty()
+        def generate(value):
+            yield value
+
+        self.assertRaises(DFEmptyError, mirror, [])
+        with config.disabled():
+            self.assertFalse(config.is_enabled())
+            self.assertEqual([], mirror([]))
+            self.assertEqual([[]], list(generate([])))
+            results = []
+            thread = threading.Thread(target=lambda: results.append(config.is_enabled()))
+            thread.start()
+            thread.join()
+            self.assertEqual([True], results)
+        self.assertTrue(config.is_enabled())
+        self.assertRaises(DFEmptyError, mirror, [])
+
+    def test_disabled_coroutine(self):
+
+        @HasColumn(['a'])
+        async def mirror(value):
+            return value
+
+        async def run():
+            with config.disabled():
+                return await mirror(None)
+
+        self.assertIsNone(asyncio.run(run()))
+        self.assertRaises(DFEmptyError, asyncio.run, mirror(None))
+
+    def test_set_enabled(self):
+
+        def mirror(value):
+            return value
+
+        config.set_enabled(False)
+        self.assertIs(mirror, NotEmpty()(mirror))
+        config.set_enabled(True)
+        self.assertIsNot(mirror, NotEmpty()(mirror))
+
+    def test_environment(self):
+        code = 'from pd_typeguard import config; print(config.is_enabled())'
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, **{config.ENV_DISABLE: '1'})
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, cwd=root)
+        self.assertEqual(b'False', output.strip())
@@ -0,0 +1,168 @@
+from unittest import TestCase, skipIf
+from threading import Lock
+from ..decorators import NotEmpty, HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue
+from ..schema import Schema
+from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError,
+                          ColumnNotSingleValueError)
+from .. import dask_backend, instrumentation
+
+import numpy as np
+import pandas as pd
+
+try:
+    import dask
+except ImportError:  # pragma: no cover
+    dask = None
+
+dd = dask_backend.dd
+_loaded = []
+_loaded_lock = Lock()
+
+
+def _load(partition):
+    with _loaded_lock:
+        _loaded.append(len(partition))
+    return partition
+
+
+def _compute(validated, **kwargs):
+    """ Computes a validated frame together with the validation between its partitions. """
+    return dask.compute(validated, validated.validation, **kwargs)[0]
+
+
+@skipIf(dd is None, 'dask is not installed')
+class TestDask(TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({'a': np.arange(20), 'b': [np.nan] * 10 + [1.] * 10, 'c': ['x'] * 20,
+                                'd': np.arange(20) % 10})
+        self.ddf = dd.from_pandas(self.df, npartitions=4)
+
+    def test_metadata(self):
+        """ Columns and dtypes are validated without computing the frame. """
+        self.assertRaises(MissingColumnError, HasColumn(['e']).validate, self.ddf)
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': 'float64'}).validate, self.ddf)
+        self.assertRaises(WrongDtypeError, Schema(dtypes={'a': 'float64'}).validate, self.ddf)
+        report = Schema(dtypes={'a': 'float64'}, notnull={'b': 'all'}).validate(self.ddf, mode='report')
+        self.assertEqual([WrongDtypeError], [type(error) for error in report])
+
+    def test_passing(self):
+        validators = [HasColumn(['a']), ColumnHasDtype({'a': 'int64'}), ColumnNotNull({'a': 'all', 'b': 'any'}),
+                      ColumnUnique(['a'], keys=[('c', 'a')]), ColumnSingleValue(['c']),
+                      Schema(dtypes={'a': 'int64'}, notnull={'b': 'any'}, unique=['a'], single_value=['c'],
+                             keys=[('c', 'a')])]
+        for validator in validators:
+            validated = validator.validate(self.ddf)
+            self.assertIsInstance(validated, dd.DataFrame)
+            pd.testing.assert_frame_equal(self.ddf.compute(), _compute(validated))
+
+    def test_violations(self):
+        """ Violations within and between partitions are raised on computation. """
+        cases = [(ColumnNotNull({'b': 'all'}), ColumnNullError),
+                 (ColumnNotNull({'b': 'any'}), None),
+                 (ColumnUnique(['d']), ColumnNotUniqueError),
+                 (ColumnUnique([], keys=[('c', 'd')]), ColumnNotUniqueError),
+                 (Schema(unique=['d']), ColumnNotUniqueError),
+                 (ColumnSingleValue(['b']), None),
+                 (Schema(single_value=['d']), ColumnNotSingleValueError)]
+        for validator, error in cases:
+            validated = validator.validate(self.ddf)
+            if error is None:
+                _compute(validated)
+            else:
+                self.assertRaises(error, _compute, validated)
+        only_null = dd.from_pandas(self.df.head(10), npartitions=3)
+        self.assertRaises(ColumnNullError, _compute, Schema(notnull={'b': 'any'}).validate(only_null))
+
+    def test_tree(self):
+        """ States of many partitions are combined in several levels. """
+        ddf = dd.from_pandas(self.df, npartitions=20)
+        _compute(Schema(unique=['a'], single_value=['c'], notnull={'b': 'any'}).validate(ddf))
+        self.assertRaises(ColumnNotUniqueError, _compute, ColumnUnique(['d']).validate(ddf))
+        ddf = dd.from_pandas(pd.DataFrame({'a': np.arange(1000) % 999}), npartitions=100)
+        self.assertRaises(ColumnNotUniqueError, _compute, ColumnUnique(['a']).validate(ddf))
+        _compute(ColumnUnique(['a']).validate(ddf.head(999, npartitions=-1, compute=False)))
+
+    def test_between_partitions(self):
+        df = pd.DataFrame({'a': [1, 2, 3, 1], 'b': [1., None, 2., None]})
+        ddf = dd.from_pandas(df, npartitions=2)
+        with self.assertRaises(ColumnNotUniqueError) as context:
+            _compute(ColumnUnique(['a']).validate(ddf))
+        self.assertEqual('a', context.exception.column)
+        self.assertIn('1 rows repeat rows of other partitions', str(context.exception))
+        with self.assertRaises(ColumnNotSingleValueError) as context:
+            _compute(ColumnSingleValue(['b']).validate(ddf))
+        self.assertEqual((1., 2.), context.exception.values)
+
+    def test_empty(self):
+        empty = dd.from_pandas(self.df.head(0), npartitions=1)
+        self.assertRaises(DFEmptyError, _compute, HasColumn(['a']).validate(empty))
+        _compute(HasColumn(['a'], allow_empty=True).validate(empty))
+        self.assertRaises(DFEmptyError, _compute, NotEmpty().validate(empty))
+        self.assertEqual(20, len(_compute(NotEmpty().validate(self.ddf))))
+
+    def test_computed_once(self):
+        """ Partitions are computed once for the validation and the result. """
+        del _loaded[:]
+        ddf = self.ddf.map_partitions(_load, meta=self.ddf._meta)
+        _compute(ColumnUnique(['a']).validate(ddf), scheduler='threads')
+        self.assertEqual(4, len(_loaded))
+
+    def test_gated(self):
+        """ Computing the frame raises the violations between partitions, only the last partition waits for them. """
+        split = dd.from_pandas(pd.DataFrame({'a': [1, 2, 1, 2]}), npartitions=2)
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique(['a']).validate(split).compute)
+        empty = dd.from_pandas(self.df.head(0), npartitions=1)
+        self.assertRaises(DFEmptyError, NotEmpty()(lambda: empty)().compute)
+        only_null = dd.from_pandas(self.df.head(10), npartitions=3)
+        self.assertRaises(ColumnNullError, ColumnNotNull({'b': 'any'}).validate(only_null).compute)
+        del _loaded[:]
+        ddf = self.ddf.map_partitions(_load, meta=self.ddf._meta)
+        self.assertEqual(5, len(ColumnUnique(['a']).validate(ddf).partitions[1].compute()))
+        self.assertEqual([5], _loaded)
+
+    def test_not_gated(self):
+        """ With gate=False, partitions are returned without waiting for the validation between partitions. """
+        validated = dask_backend.validate(ColumnUnique(['d']), self.ddf, gate=False)
+        pd.testing.assert_frame_equal(self.ddf.compute(), validated.compute())
+        self.assertRaises(ColumnNotUniqueError, validated.validation.compute)
+        within = dask_backend.validate(ColumnUnique(['c']), self.ddf, gate=False)
+        self.assertRaises(ColumnNotUniqueError, within.compute)
+        self.assertRaises(MissingColumnError, dask_backend.validate, HasColumn(['e']), self.ddf, gate=False)
+        del _loaded[:]
+        ddf = self.ddf.map_partitions(_load, meta=self.ddf._meta)
+        validated = dask_backend.validate(ColumnUnique(['a']), ddf, gate=False)
+        self.assertEqual(5, len(validated.partitions[3].compute()))
+        self.assertEqual([5], _loaded)
+
+    def test_not_computed(self):
+        """ Validation and instrumentation do not compute the frame. """
+        sink = instrumentation.Sink()
+        instrumentation.register_sink(sink)
+        del _loaded[:]
+        try:
+            ddf = self.ddf.map_partitions(_load, meta=self.ddf._meta)
+            for validator in [NotEmpty(), HasColumn(['a'])]:
+                self.assertIsInstance(validator(lambda: ddf)(), dd.DataFrame)
+        finally:
+            instrumentation.unregister_sink(sink)
+        self.assertEqual([], _loaded)
+
+    def test_process_scheduler(self):
+        """ Validators with a cache and stats are sent to other processes without them. """
+        sink = instrumentation.Sink()
+        instrumentation.register_sink(sink)
+        try:
+            validator = ColumnUnique(['a'], cache=True)
+            validator.validate(self.df)
+            validator._validate_result(self.df)
+        finally:
+            instrumentation.unregister_sink(sink)
+        self.assertIsNotNone(validator.stats)
+        split = dd.from_pandas(pd.DataFrame({'a': [1, 2, 1, 2]}), npartitions=2)
+        self.assertRaises(ColumnNotUniqueError, validator.validate(split).compute, scheduler='processes')
+        self.assertEqual(20, len(validator.validate(self.ddf).compute(scheduler='processes')))
+
+    def test_merge_states(self):
+        validator = NotEmpty()
+        self.assertEqual({'n_items': 3}, validator._merge_states({'n_items': 1}, {'n_items': 2}))
@@ -1,9 +1,15 @@
-from unittest import TestCase
+from unittest import TestCase, mock
+from concurrent.futures import ThreadPoolExecutor
 from ..decorators import (ReturnValueDecorator, NotEmpty, HasColumn, ColumnHasDtype,
                           ColumnNotNull, ColumnUnique, ColumnSingleValue)
+from .. import decorators
 from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError,
                           ColumnNotUniqueError, ColumnNotSingleValueError)
 
+import asyncio
+import inspect
+import threading
+import numpy as np
 import pandas as pd
 
 
@@ -116,6 +122,33 @@ class TestHasColumn(TestCase):
         self.assertIsNotNone(mirror(pd.DataFrame(columns=['a', 'b', 'c', 'd'])))
         self.assertRaises(MissingColumnError, mirror, pd.DataFrame(columns=['a', 'b', 'd']))
 
+    def test_wraps(self):
+        """ Wrappers keep name, docstring and signature of all kinds of functions. """
+
+        def load(path, nrows=None):
+            """ Loads a frame. """
+            return pd.DataFrame({'a': [1]})
+
+        async def load_async(path, nrows=None):
+            """ Loads a frame. """
+
+        def generate(path, nrows=None):
+            """ Loads a frame. """
+            yield pd.DataFrame({'a': [1]})
+
+        async def generate_async(path, nrows=None):
+            """ Loads a frame. """
+            yield pd.DataFrame({'a': [1]})
+
+        for fcn in (load, load_async, generate, generate_async):
+            wrapper = HasColumn(['a'])(fcn)
+            self.assertIsNot(fcn, wrapper)
+            self.assertIs(fcn, wrapper.__wrapped__)
+            self.assertEqual((fcn.__name__, fcn.__qualname__, fcn.__doc__),
+                             (wrapper.__name__, wrapper.__qualname__, wrapper.__doc__))
+            self.assertEqual(inspect.signature(fcn), inspect.signature(wrapper))
+        self.assertTrue(inspect.iscoroutinefunction(HasColumn(['a'])(load_async)))
+
     def test_validate_default(self):
         validate = HasColumn(['a']).validate
         self.assertRaises(DFEmptyError, validate, None)
@@ -134,6 +167,36 @@ class TestHasColumn(TestCase):
         self.assertRaises(MissingColumnError, validate, pd.DataFrame(columns=['a', 'b', 'd']))
         self.assertIsNone(validate(None))
 
+    def test_column_names(self):
+        """ Duplicate column names and tuple names are looked up in the columns Index. """
+        HasColumn(['a', 'b']).validate(pd.DataFrame([[1, 2, 3]], columns=['a', 'a', 'b']))
+        self.assertRaises(MissingColumnError, HasColumn(['c']).validate, pd.DataFrame([[1, 2]], columns=['a', 'a']))
+        df = pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([('a', 'x'), ('b', 'y')]))
+        HasColumn([('a', 'x')]).validate(df)
+        with self.assertRaises(MissingColumnError) as context:
+            HasColumn([('a', 'x'), ('a', 'y'), 'b']).validate(df)
+        self.assertEqual([('a', 'y'), 'b'], context.exception.columns)
+
+    def test_layout(self):
+        """ The layout is compiled once for frames with equal columns and dtypes. """
+        validator = ColumnHasDtype({'b': 'int64', 'a': 'float64'})
+        df = pd.DataFrame({'a': [1.], 'b': [1], 'c': ['x']})
+        validator.validate(df)
+        with mock.patch.object(decorators, '_column_positions', side_effect=decorators._column_positions) as compile:
+            validator.validate(df)
+            validator.validate(df.copy())
+            validator.validate(pd.DataFrame({'a': [2.], 'b': [2], 'c': ['y']}))
+            self.assertEqual(0, compile.call_count)
+            self.assertRaises(WrongDtypeError, validator.validate, df.astype({'a': 'int64'}))
+            self.assertRaises(MissingColumnError, validator.validate, df[['a', 'c']])
+            self.assertRaises(MissingColumnError, validator.validate, df[['a', 'c']])
+            validator.validate(df[['b', 'a']])
+        self.assertEqual(3, compile.call_count)
+        self.assertEqual({'a': 1, 'b': 0}, validator._last_layout.positions)
+        with mock.patch.object(pd.DataFrame, 'dtypes', new_callable=mock.PropertyMock,
+                               side_effect=AssertionError('dtypes of all columns read')):
+            validator.validate(pd.DataFrame({'b': [3], 'a': [3.]}))
+
 
 class TestColumnHasDtype(TestCase):
 
@@ -157,6 +220,27 @@ class TestColumnHasDtype(TestCase):
         self.assertIs(df_valid, validate(df_valid))
         self.assertRaises(WrongDtypeError, validate, df_invalid)
 
+    def test_dtype_specs(self):
+        """ Expected dtypes are normalized once, specs of several dtypes are kept. """
+        df = pd.DataFrame({'a': [1], 'b': pd.Categorical(['x']), 'c': pd.array([1], dtype='Int64'), 'd': ['x']})
+        ColumnHasDtype({'a': int, 'b': 'category', 'c': 'Int64', 'd': object}).validate(df)
+        ColumnHasDtype({'a': np.dtype('int64'), 'b': pd.CategoricalDtype(['x']), 'c': pd.Int64Dtype()}).validate(df)
+        with self.assertRaises(WrongDtypeError) as context:
+            ColumnHasDtype({'a': 'float64', 'b': 'category', 'c': 'int64', 'd': 'str'}).validate(df)
+        self.assertEqual(['a', 'c', 'd'], list(context.exception.dtypes))
+        self.assertEqual((np.dtype('int64'), 'float64'), context.exception.dtypes['a'])
+
+    def test_wide_frame(self):
+        """ Columns are not accessed one by one. """
+        df = pd.DataFrame(np.zeros((2, 5000)), columns=['c%i' % i for i in range(5000)])
+        validator = ColumnHasDtype({'c%i' % i: 'float64' for i in range(0, 5000, 2)})
+        with mock.patch.object(pd.DataFrame, '__getitem__', side_effect=AssertionError('column accessed')):
+            self.assertIs(df, validator.validate(df))
+        df['c4998'] = df['c4998'].astype(int)
+        with self.assertRaises(WrongDtypeError) as context:
+            validator.validate(df)
+        self.assertEqual(['c4998'], list(context.exception.dtypes))
+
 
 class TestColumnNotNull(TestCase):
 
@@ -201,6 +285,12 @@ class TestColumnNotNull(TestCase):
         self.assertRaises(ColumnNullError, validate_any, df_a_null)
         self.assertRaises(ColumnNullError, validate_all, df_a_null)
 
+    def test_validate_declared_only(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': [None, None], 'c': pd.array([1, None], dtype='Int64')})
+        self.assertIs(df, ColumnNotNull({'a': 'all'}).validate(df))
+        self.assertIs(df, ColumnNotNull({'c': 'any'}).validate(df))
+        self.assertRaises(ColumnNullError, ColumnNotNull({'a': 'all', 'c': 'all'}).validate, df)
+
 
 class TestColumnUnique(TestCase):
 
@@ -210,6 +300,8 @@ class TestColumnUnique(TestCase):
 
         validate = ColumnUnique({}, allow_none=True).validate
         self.assertEqual(validate(None), None)
+        self.assertIsNone(ColumnUnique(['a'], True).validate(None))
+        self.assertIs(True, ColumnUnique(['a'], False, True).allow_empty)
 
     def test_validate_simple(self):
         df_valid = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y'], 'c': ['z', 'z']})
@@ -220,6 +312,14 @@ class TestColumnUnique(TestCase):
         validate = ColumnUnique(['c']).validate
         self.assertRaises(ColumnNotUniqueError, validate, df_valid)
 
+    def test_validate_keys(self):
+        df = pd.DataFrame({'account_id': [1, 1, 2], 'date': ['x', 'y', 'x'], 'n': [1., None, None]})
+        self.assertIs(df, ColumnUnique([], keys=[('account_id', 'date')]).validate(df))
+        self.assertIsNotNone(ColumnUnique(['n'], keys=[('account_id', 'n')]).validate(df.head(2)))
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique([], keys=[('date', 'n')]).validate, df.iloc[[0, 2, 2]])
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique(['n']).validate, df)
+        self.assertRaises(MissingColumnError, ColumnUnique([], keys=[('account_id', 'other')]).validate, df)
+
 
 class TestColumnSingleValue(TestCase):
 
@@ -240,3 +340,136 @@ class TestColumnSingleValue(TestCase):
         self.assertIs(df_valid, validate(df_valid))
         validate = ColumnSingleValue(['b', 'c']).validate
         self.assertIs(df_valid, validate(df_valid))
+
+    def test_validate_nulls_and_categories(self):
+        df = pd.DataFrame({'f': [1., None, 1.], 'cat': pd.Categorical(['a', None, 'a'], categories=['a', 'b']),
+                           'cat_multi': pd.Categorical(['a', None, 'b']), 'i': [1, 2, 1]})
+        self.assertIs(df, ColumnSingleValue(['f', 'cat']).validate(df))
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['cat_multi']).validate, df)
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['i']).validate, df)
+        df_long = pd.DataFrame({'a': [0] * 5000 + [1] + [0] * 5000})
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['a']).validate, df_long)
+
+
+class TestValidateStream(TestCase):
+
+    @staticmethod
+    def chunks(*frames):
+        for frame in frames:
+            yield frame
+
+    def test_decorator(self):
+        decorator = ColumnUnique(['a'])
+
+        @decorator
+        def generate(*frames):
+            for frame in frames:
+                yield frame
+
+        df_1 = pd.DataFrame({'a': [1, 2]})
+        df_2 = pd.DataFrame({'a': [3]})
+        self.assertEqual([df_1, df_2], list(generate(df_1, df_2)))
+        result = generate(df_1, df_1)
+        self.assertIs(df_1, next(result))
+        self.assertRaises(ColumnNotUniqueError, next, result)
+        self.assertRaises(DFEmptyError, list, generate())
+
+    def test_not_empty(self):
+        validate_stream = NotEmpty().validate_stream
+        self.assertEqual(2, len(list(validate_stream(self.chunks(pd.DataFrame(), pd.DataFrame({'a': [1]}))))))
+        self.assertRaises(DFEmptyError, list, validate_stream(self.chunks(pd.DataFrame(), [])))
+        self.assertRaises(DFEmptyError, list, validate_stream(self.chunks(None)))
+        self.assertRaises(DFEmptyError, list, NotEmpty(allow_scalar=False).validate_stream(self.chunks(1)))
+
+    def test_has_column(self):
+        df = pd.DataFrame({'a': [1]})
+        self.assertRaises(MissingColumnError, list, HasColumn(['b']).validate_stream(self.chunks(df)))
+        self.assertRaises(DFEmptyError, list, HasColumn(['a']).validate_stream(self.chunks(df.head(0))))
+        self.assertEqual(1, len(list(HasColumn(['a'], allow_empty=True).validate_stream(self.chunks(df.head(0))))))
+        self.assertRaises(WrongDtypeError, list, ColumnHasDtype({'a': 'float64'}).validate_stream(self.chunks(df)))
+
+    def test_not_null(self):
+        df_null = pd.DataFrame({'a': [None, None], 'b': [1, 2]})
+        df_valid = pd.DataFrame({'a': [1., None], 'b': [1, 2]})
+        validate_stream = ColumnNotNull({'a': 'any', 'b': 'all'}).validate_stream
+        self.assertEqual(2, len(list(validate_stream(self.chunks(df_null, df_valid)))))
+        self.assertRaises(ColumnNullError, list, validate_stream(self.chunks(df_null, df_null)))
+        self.assertRaises(ColumnNullError, list, ColumnNotNull({'a': 'all'}).validate_stream(self.chunks(df_valid)))
+
+    def test_unique(self):
+        df_1 = pd.DataFrame({'a': [1, 2], 'b': ['x', 'x']})
+        df_2 = pd.DataFrame({'a': [3, 4], 'b': ['x', 'y']})
+        self.assertEqual(2, len(list(ColumnUnique(['a'], keys=[('a', 'b')]).validate_stream(self.chunks(df_1, df_2)))))
+        self.assertRaises(ColumnNotUniqueError, list, ColumnUnique([], keys=[('a', 'b')]).validate_stream(
+            self.chunks(df_1, df_1)))
+
+    def test_unique_dtype_change(self):
+        """ Numbers repeat across chunks whose dtype changed, like int columns read as float once nulls occur. """
+        df_int = pd.DataFrame({'a': [1, 2], 'b': ['x', 'x']})
+        df_float = pd.DataFrame({'a': [1., None], 'b': ['x', 'x']})
+        for validator in (ColumnUnique(['a']), ColumnUnique([], keys=[('a', 'b')])):
+            self.assertRaises(ColumnNotUniqueError, list, validator.validate_stream(self.chunks(df_int, df_float)))
+        self.assertRaises(ColumnNotUniqueError, list, ColumnUnique(['a']).validate_stream(
+            self.chunks(df_float, df_int.astype({'a': 'Int64'}).reindex([1, 0, 2]))))
+        chunks = self.chunks(df_int, df_float.assign(a=[3., None]))
+        self.assertEqual(2, len(list(ColumnUnique(['a']).validate_stream(chunks))))
+
+    def test_single_value(self):
+        df_1 = pd.DataFrame({'a': [None, 1.], 'c': pd.Categorical(['x', None])})
+        df_2 = pd.DataFrame({'a': [1., 1.], 'c': pd.Categorical(['x', 'x'], categories=['y', 'x'])})
+        df_3 = pd.DataFrame({'a': [2., None], 'c': pd.Categorical(['y', 'y'])})
+        validate_stream = ColumnSingleValue(['a']).validate_stream
+        self.assertEqual(2, len(list(validate_stream(self.chunks(df_1, df_2)))))
+        self.assertRaises(ColumnNotSingleValueError, list, validate_stream(self.chunks(df_1, df_3)))
+        validate_stream = ColumnSingleValue(['c']).validate_stream
+        self.assertEqual(2, len(list(validate_stream(self.chunks(df_1, df_2)))))
+        self.assertRaises(ColumnNotSingleValueError, list, validate_stream(self.chunks(df_2, df_3)))
+
+
+class TestAsync(TestCase):
+
+    def test_coroutine(self):
+
+        @ColumnUnique(['a'])
+        async def mirror(value):
+            return value
+
+        df = pd.DataFrame({'a': [1, 2]})
+        self.assertIs(df, asyncio.run(mirror(df)))
+        self.assertRaises(ColumnNotUniqueError, asyncio.run, mirror(pd.DataFrame({'a': [1, 1]})))
+
+    def test_executor(self):
+        thread_ids = []
+
+        class ThreadUnique(ColumnUnique):
+
+            def validate(self, value):
+                thread_ids.append(threading.get_ident())
+                return super(ThreadUnique, self).validate(value)
+
+        async def mirror(value):
+            return value
+
+        df = pd.DataFrame({'a': [1, 2]})
+        with ThreadPoolExecutor(1) as executor:
+            self.assertIs(df, asyncio.run(ThreadUnique(['a'], executor=executor)(mirror)(df)))
+        self.assertIs(df, asyncio.run(ThreadUnique(['a'], executor=True)(mirror)(df)))
+        self.assertNotIn(threading.get_ident(), thread_ids)
+        self.assertRaises(ColumnNotUniqueError, asyncio.run,
+                          ThreadUnique(['a'], executor=True)(mirror)(pd.DataFrame({'a': [1, 1]})))
+        self.assertRaises(TypeError, ColumnUnique, ['a'], executor=1)
+
+    def test_async_generator(self):
+
+        @ColumnUnique(['a'], executor=True)
+        async def generate(*frames):
+            for frame in frames:
+                yield frame
+
+        async def collect(chunks):
+            return [chunk async for chunk in chunks]
+
+        df = pd.DataFrame({'a': [1, 2]})
+        self.assertEqual([df], asyncio.run(collect(generate(df))))
+        self.assertRaises(ColumnNotUniqueError, asyncio.run, collect(generate(df, df)))
+        self.assertRaises(DFEmptyError, asyncio.run, collect(generate()))
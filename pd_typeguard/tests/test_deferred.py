@@ -0,0 +1,162 @@
+from unittest import TestCase
+from threading import Event, Thread
+from ..decorators import HasColumn, ColumnNotNull, ColumnUnique
+from ..deferred import DeferredPool, get_default_pool
+from ..exceptions import ColumnNullError, ColumnNotUniqueError, MissingColumnError
+from .. import config, dask_backend, polars_backend
+
+import asyncio
+import pandas as pd
+
+
+class BlockingUnique(ColumnUnique):
+
+    def __init__(self, release, **kwargs):
+        super(BlockingUnique, self).__init__(['a'], **kwargs)
+        self.release = release
+
+    def validate(self, value):
+        self.release.wait(5)
+        return super(BlockingUnique, self).validate(value)
+
+
+class TestDeferredPool(TestCase):
+
+    def setUp(self):
+        self.valid = pd.DataFrame({'a': [1, 2]})
+        self.invalid = pd.DataFrame({'a': [1, 1]})
+
+    def test_deferred(self):
+        """ Results are returned as they are, violations are queued. """
+        pool = DeferredPool()
+
+        @ColumnUnique(['a'], deferred=pool)
+        def mirror(value):
+            return value
+
+        self.assertIs(self.valid, mirror(self.valid))
+        self.assertIs(self.invalid, mirror(self.invalid))
+        self.assertTrue(pool.join(5))
+        fcn, error = pool.errors.get_nowait()
+        self.assertIs(mirror.__wrapped__, fcn)
+        self.assertIsInstance(error, ColumnNotUniqueError)
+        self.assertTrue(pool.errors.empty())
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique(['a'], deferred=pool).validate, self.invalid)
+
+    def test_callback(self):
+        reported = []
+        pool = DeferredPool(workers=2, on_error=lambda fcn, error: reported.append((fcn, type(error))))
+
+        @HasColumn(['b'], deferred=pool)
+        def mirror(value):
+            return value
+
+        async def mirror_async(value):
+            return value
+
+        mirror(self.valid)
+        self.assertIs(self.valid, asyncio.run(HasColumn(['b'], deferred=pool)(mirror_async)(self.valid)))
+        self.assertTrue(pool.join(5))
+        self.assertEqual([MissingColumnError] * 2, [error for _, error in reported])
+        self.assertEqual({mirror.__wrapped__, mirror_async}, {fcn for fcn, _ in reported})
+
+    def test_backpressure(self):
+        """ Submits beyond max_pending wait for a free slot, or skip the validation. """
+        release = Event()
+        pool = DeferredPool(max_pending=1)
+        mirror = BlockingUnique(release, deferred=pool)(lambda value: value)
+        mirror(self.invalid)
+        second = Thread(target=mirror, args=(self.valid,))
+        second.start()
+        second.join(0.05)
+        self.assertTrue(second.is_alive())
+        self.assertEqual(1, pool.pending)
+        release.set()
+        second.join(5)
+        self.assertTrue(pool.join(5))
+        self.assertEqual(1, pool.errors.qsize())
+        release.clear()
+        pool = DeferredPool(max_pending=1, block=False, max_errors=1)
+        mirror = BlockingUnique(release, deferred=pool)(lambda value: value)
+        mirror(self.invalid)
+        self.assertIs(self.invalid, mirror(self.invalid))
+        self.assertEqual(1, pool.skipped)
+        release.set()
+        self.assertTrue(pool.join(5))
+        mirror(self.invalid)
+        self.assertTrue(pool.join(5))
+        self.assertEqual(1, pool.dropped_errors)
+
+    def test_async_backpressure(self):
+        """ Coroutines await a free slot without blocking the event loop, and give it back when cancelled. """
+        release = Event()
+        pool = DeferredPool(max_pending=1)
+        validator = BlockingUnique(release, deferred=pool)
+
+        async def mirror(value):
+            return value
+
+        async def submit(cancel):
+            submitted = asyncio.ensure_future(validator(mirror)(self.valid))
+            await asyncio.sleep(0.05)
+            self.assertFalse(submitted.done())
+            if cancel:
+                submitted.cancel()
+            release.set()
+            return None if cancel else await submitted
+
+        validator(lambda value: value)(self.invalid)
+        self.assertIs(self.valid, asyncio.run(submit(False)))
+        self.assertTrue(pool.join(5))
+        release.clear()
+        validator(lambda value: value)(self.invalid)
+        asyncio.run(submit(True))
+        self.assertTrue(pool.join(5))
+        pool._waiters.shutdown(wait=True)
+        self.assertTrue(pool._slots.acquire(blocking=False))
+        self.assertEqual(2, pool.errors.qsize())
+
+    def test_detached_errors(self):
+        """ Queued violations keep their diagnostics, but not the validated frame. """
+        pool = DeferredPool()
+        ColumnUnique(['a'], deferred=pool)(lambda value: value)(self.invalid)
+        self.assertTrue(pool.join(5))
+        _, error = pool.errors.get_nowait()
+        self.assertIsNone(error._data)
+        self.assertIsNone(error.__traceback__)
+        self.assertEqual(([1], [1], 1), (error.positions, error.values, error.n_duplicates))
+        self.assertIn('not unique', str(error))
+
+    def test_disabled(self):
+        pool = DeferredPool()
+        mirror = ColumnUnique(['a'], deferred=pool)(lambda value: value)
+        with config.disabled():
+            mirror(self.invalid)
+        self.assertTrue(pool.join(5))
+        self.assertTrue(pool.errors.empty())
+
+    def test_options(self):
+        self.assertIs(get_default_pool(), HasColumn(['a'], deferred=True).deferred)
+        self.assertRaises(TypeError, HasColumn, ['a'], deferred=1)
+        self.assertRaises(ValueError, DeferredPool, max_pending=0)
+        self.assertEqual(HasColumn(['a']).signature, HasColumn(['a'], deferred=True).signature)
+
+    def test_lazy(self):
+        """ Lazy results are returned with their content checks instead of being deferred. """
+        pool = DeferredPool()
+        mirror = ColumnNotNull({'a': 'all'}, deferred=pool)(lambda value: value)
+
+        async def mirror_async(value):
+            return value
+
+        lazy = []
+        if polars_backend.pl is not None:
+            lazy.append(polars_backend.pl.LazyFrame({'a': [1, None]}))
+        if dask_backend.dd is not None:
+            lazy.append(dask_backend.dd.from_pandas(pd.DataFrame({'a': [1, None]}), npartitions=1))
+        for frame in lazy:
+            self.assertRaises(ColumnNullError, getattr(mirror(frame), 'compute', None) or mirror(frame).collect)
+            validated = asyncio.run(ColumnNotNull({'a': 'all'}, deferred=pool)(mirror_async)(frame))
+            self.assertRaises(ColumnNullError, getattr(validated, 'compute', None) or validated.collect)
+        self.assertTrue(pool.join(5))
+        self.assertEqual(0, pool.pending)
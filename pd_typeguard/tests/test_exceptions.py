@@ -0,0 +1,124 @@
+from unittest import TestCase, mock
+import pickle
+from ..decorators import HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue
+from ..schema import Schema
+from ..exceptions import (ReturnValueError, DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError,
+                          ColumnNotUniqueError, ColumnNotSingleValueError)
+
+import numpy as np
+import pandas as pd
+
+
+class TestExceptions(TestCase):
+
+    def test_message(self):
+        error = DFEmptyError('empty')
+        self.assertEqual('empty', str(error))
+        self.assertEqual(('empty',), error.args)
+        error = ColumnNullError('custom', null_counts={'a': 1})
+        self.assertEqual('custom', str(error))
+        self.assertEqual({'a': 1}, error.null_counts)
+        error = ColumnNullError(null_counts={'a': 1})
+        self.assertEqual((), error.args)
+        self.assertEqual("ColumnNullError('Unexpected Null values in columns: a')", repr(error))
+
+    def test_missing_column(self):
+        with self.assertRaises(MissingColumnError) as context:
+            HasColumn(['a', 'b', 'c']).validate(pd.DataFrame(columns=['b']))
+        self.assertEqual(['a', 'c'], context.exception.columns)
+        self.assertEqual('missing columns: a,c', str(context.exception))
+
+    def test_wrong_dtype(self):
+        for validator in [ColumnHasDtype({'a': 'int64', 'b': 'float64'}),
+                          Schema(dtypes={'a': 'int64', 'b': 'float64'})]:
+            with self.assertRaises(WrongDtypeError) as context:
+                validator.validate(pd.DataFrame({'a': [1], 'b': ['x']}))
+            self.assertEqual(['b'], list(context.exception.dtypes))
+            self.assertEqual(np.dtype(object), context.exception.dtypes['b'][0])
+            self.assertIn('b: object (expected float64)', str(context.exception))
+
+    def test_null(self):
+        df = pd.DataFrame({'a': [1., None, 3., None], 'b': [1, 2, 3, 4]})
+        for validator in [ColumnNotNull({'a': 'all', 'b': 'all'}), Schema(notnull={'a': 'all', 'b': 'all'})]:
+            with self.assertRaises(ColumnNullError) as context:
+                validator.validate(df)
+            error = context.exception
+            self.assertEqual({'a': 2}, error.null_counts)
+            self.assertEqual(['a'], error.columns)
+            self.assertEqual(4, error.n_rows)
+            self.assertEqual({'a': [1, 3]}, error.positions)
+            self.assertIn('a: 2 (not null expected: all)', str(error))
+            self.assertEqual(['a'], list(error._get_data()))
+
+    def test_not_unique(self):
+        df = pd.DataFrame({'a': [1, 2, 1, 3, 2, 1], 'b': ['x', 'x', 'y', 'y', 'x', 'x']})
+        for validator in [ColumnUnique(['a']), Schema(unique=['a'])]:
+            with self.assertRaises(ColumnNotUniqueError) as context:
+                validator.validate(df)
+            error = context.exception
+            self.assertEqual('a', error.column)
+            self.assertEqual(3, error.n_duplicates)
+            self.assertEqual([2, 4, 5], error.positions)
+            self.assertEqual([1, 2, 1], error.values)
+            self.assertIn('Column a is not unique! 3 duplicate rows, first duplicate item: 1', str(error))
+        for validator in [ColumnUnique([], keys=[('a', 'b')]), Schema(keys=[('a', 'b')])]:
+            with self.assertRaises(ColumnNotUniqueError) as context:
+                validator.validate(df)
+            error = context.exception
+            self.assertEqual(('a', 'b'), error.column)
+            self.assertTrue(error.is_key)
+            self.assertEqual(2, error.n_duplicates)
+            self.assertEqual([4, 5], error.positions)
+            self.assertEqual([(2, 'x'), (1, 'x')], error.values)
+
+    def test_max_samples(self):
+        df = pd.DataFrame({'a': np.zeros(100)})
+        with mock.patch('pd_typeguard.exceptions.max_samples', 3):
+            with self.assertRaises(ColumnNotUniqueError) as context:
+                ColumnUnique(['a']).validate(df)
+            self.assertEqual(99, context.exception.n_duplicates)
+            self.assertEqual([1, 2, 3], context.exception.positions)
+            self.assertEqual(3, len(context.exception.values))
+
+    def test_lazy(self):
+        """ Diagnostics are not computed until they are read. """
+        df = pd.DataFrame({'a': [1, 1, 2]})
+        with mock.patch.object(ColumnNotUniqueError, '_format', side_effect=AssertionError) as format_message, \
+                mock.patch.object(pd.Series, 'duplicated', side_effect=AssertionError) as duplicated:
+            self.assertRaises(ColumnNotUniqueError, ColumnUnique(['a']).validate, df)
+            format_message.assert_not_called()
+            duplicated.assert_not_called()
+
+    def test_single_value(self):
+        df = pd.DataFrame({'a': [1., None, 1., 2., 3.]})
+        for validator in [ColumnSingleValue(['a']), Schema(single_value=['a'])]:
+            with self.assertRaises(ColumnNotSingleValueError) as context:
+                validator.validate(df)
+            error = context.exception
+            self.assertEqual('a', error.column)
+            self.assertEqual((1., 2.), error.values)
+            self.assertEqual([3, 4], error.positions)
+            self.assertIn('Column a has multiple values! First two values:', str(error))
+
+    def test_pickle(self):
+        with self.assertRaises(ColumnNotUniqueError) as context:
+            ColumnUnique(['a']).validate(pd.DataFrame({'a': [1, 1]}))
+        error = pickle.loads(pickle.dumps(context.exception))
+        self.assertIsInstance(error, ReturnValueError)
+        self.assertEqual(str(context.exception), str(error))
+        self.assertEqual('a', error.column)
+        self.assertIsNone(error.positions)
+
+    def test_detach(self):
+        """ Detached exceptions keep their diagnostics without the data. """
+        df = pd.DataFrame({'a': [1., None, 1., 2.], 'b': [1, 2, 2, 3]})
+        for validator in [ColumnNotNull({'a': 'all'}), ColumnUnique(['b']), ColumnSingleValue(['a'])]:
+            with self.assertRaises(ReturnValueError) as context:
+                validator.validate(df)
+            error = context.exception
+            message, positions = str(error), error.positions
+            error._detach()
+            self.assertIsNone(error._get_data())
+            self.assertEqual((message, positions), (str(error), error.positions))
+            if isinstance(error, ColumnNotUniqueError):
+                self.assertEqual(([2], 1), (error.values, error.n_duplicates))
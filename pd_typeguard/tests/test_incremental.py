@@ -0,0 +1,88 @@
+from unittest import TestCase
+from ..decorators import NotEmpty, ColumnNotNull, ColumnUnique, ColumnSingleValue
+from ..schema import Schema
+from ..incremental import IncrementalValidator
+from ..exceptions import DFEmptyError, ColumnNullError, ColumnNotUniqueError, ColumnNotSingleValueError
+
+import numpy as np
+import pandas as pd
+
+
+class TestIncrementalValidator(TestCase):
+
+    def test_unique(self):
+        for validator in [ColumnUnique(['a'], keys=[('a', 'b')]), Schema(unique=['a'], keys=[('a', 'b')])]:
+            table = validator.incremental()
+            self.assertIsInstance(table, IncrementalValidator)
+            batch = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+            self.assertIs(batch, table.validate(batch))
+            table.validate(pd.DataFrame({'a': [3], 'b': ['x']}))
+            self.assertEqual(3, table.n_rows)
+            self.assertRaises(ColumnNotUniqueError, table.validate, pd.DataFrame({'a': [4, 4], 'b': ['x', 'y']}))
+            self.assertRaises(ColumnNotUniqueError, table.validate, pd.DataFrame({'a': [5, 3], 'b': ['x', 'y']}))
+            table.validate(pd.DataFrame({'a': [4, 5], 'b': ['x', 'y']}))
+            self.assertEqual(5, table.n_rows)
+            table.finish()
+
+    def test_key(self):
+        table = ColumnUnique([], keys=[('a', 'b')]).incremental()
+        table.validate(pd.DataFrame({'a': [1, 1], 'b': ['x', 'y']}))
+        table.validate(pd.DataFrame({'a': [2, 2], 'b': ['x', 'y']}))
+        self.assertRaises(ColumnNotUniqueError, table.validate, pd.DataFrame({'a': [3, 2], 'b': ['x', 'y']}))
+
+    def test_rejected_batch(self):
+        """ A failing batch is not added to the state. """
+        table = ColumnUnique(['a', 'b']).incremental()
+        table.validate(pd.DataFrame({'a': [1], 'b': [1]}))
+        self.assertRaises(ColumnNotUniqueError, table.validate, pd.DataFrame({'a': [2], 'b': [1]}))
+        self.assertEqual(1, table.n_rows)
+        table.validate(pd.DataFrame({'a': [2], 'b': [2]}))
+        hashes = table._state['hashes'][('a', False)]
+        self.assertEqual([(np.dtype(np.uint64), 2)], [(run.dtype, len(run)) for run in hashes])
+        self.assertTrue((np.diff(hashes[0]) > 0).all())
+        self.assertRaises(ColumnNotUniqueError, table.validate, pd.DataFrame({'a': [3, 1], 'b': [3, 4]}))
+        self.assertIs(hashes, table._state['hashes'][('a', False)])
+        table.reset()
+        self.assertEqual(0, table.n_rows)
+        table.validate(pd.DataFrame({'a': [1], 'b': [1]}))
+
+    def test_runs(self):
+        """ Hashes are kept in O(log(rows)) sorted runs, and batches are found in any of them. """
+        table = Schema(unique=['a']).incremental()
+        for i in range(100):
+            table.validate(pd.DataFrame({'a': np.arange(i * 10, i * 10 + 10)}))
+        runs = table._state['hashes']['a']
+        self.assertEqual([640, 320, 40], [len(run) for run in runs])
+        self.assertTrue(all((np.diff(run) > 0).all() for run in runs))
+        for first in (0, 650, 995):
+            self.assertRaises(ColumnNotUniqueError, table.validate, pd.DataFrame({'a': [first + 1000, first]}))
+        self.assertIs(runs, table._state['hashes']['a'])
+
+    def test_not_null(self):
+        table = ColumnNotNull({'a': 'any', 'b': 'all'}).incremental()
+        for validator in (table, Schema(notnull={'a': 'any', 'b': 'all'}).incremental()):
+            validator.validate(pd.DataFrame({'a': [None, None], 'b': [1, 2]}, dtype=float))
+            with self.assertRaises(ColumnNullError) as context:
+                validator.finish()
+            self.assertEqual(({'a': 2}, 2), (context.exception.null_counts, context.exception.n_rows))
+            self.assertIn('of length 2: a: 2 (not null expected: any)', str(context.exception))
+        self.assertRaises(ColumnNullError, table.validate, pd.DataFrame({'a': [1.], 'b': [None]}))
+        self.assertRaises(ColumnNullError, table.finish)
+        table.validate(pd.DataFrame({'a': [1.], 'b': [3.]}))
+        table.finish()
+
+    def test_single_value(self):
+        for validator in [ColumnSingleValue(['a']), Schema(single_value=['a'])]:
+            table = validator.incremental()
+            table.validate(pd.DataFrame({'a': [None]}, dtype=float))
+            self.assertRaises(ColumnNotSingleValueError, table.validate, pd.DataFrame({'a': [1., 2.]}))
+            table.validate(pd.DataFrame({'a': [2., 2.]}))
+            self.assertRaises(ColumnNotSingleValueError, table.validate, pd.DataFrame({'a': [1.]}))
+
+    def test_empty(self):
+        self.assertRaises(DFEmptyError, ColumnUnique(['a']).incremental().finish)
+        self.assertRaises(DFEmptyError, NotEmpty().incremental().finish)
+        table = NotEmpty().incremental()
+        table.validate([1, 2])
+        self.assertEqual(2, table.n_rows)
+        table.finish()
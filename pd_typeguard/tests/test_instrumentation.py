@@ -0,0 +1,77 @@
+from unittest import TestCase
+from ..instrumentation import Sink, ValidatorStats, register_sink, unregister_sink, LATENCY_BUCKETS
+from ..decorators import ColumnNotNull
+from ..exceptions import ColumnNullError, DFEmptyError
+
+import pandas as pd
+import pickle
+
+
+class RecordingSink(Sink):
+
+    def __init__(self):
+        self.events = []
+
+    def record(self, validator, n_rows, seconds, error):
+        self.events.append((validator, n_rows, type(error)))
+
+
+class TestValidatorStats(TestCase):
+
+    def test_record(self):
+        stats = ValidatorStats()
+        stats.record(0, 0., None)
+        stats.record(150, 0.5, ColumnNullError('a'))
+        stats.record(999, 100., ColumnNullError('a'))
+        self.assertEqual(3, stats.calls)
+        self.assertEqual({'ColumnNullError': 2}, dict(stats.failures))
+        self.assertEqual(1, stats.histograms[0][0])
+        self.assertEqual(1, stats.histograms[3][5])
+        self.assertEqual(1, stats.histograms[3][len(LATENCY_BUCKETS)])
+        copied = pickle.loads(pickle.dumps(stats))
+        self.assertEqual((3, stats.histograms), (copied.calls, copied.histograms))
+        copied.record(0, 0., None)
+        self.assertEqual(3, stats.calls)
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self):
+        self.sink = RecordingSink()
+
+    def tearDown(self):
+        unregister_sink(self.sink)
+
+    def test_sink(self):
+        validator = ColumnNotNull({'a': 'all'})
+
+        @validator
+        def mirror(value):
+            return value
+
+        df_valid = pd.DataFrame({'a': [1, 2]})
+        mirror(df_valid)
+        self.assertIsNone(validator.stats)
+        register_sink(self.sink)
+        register_sink(self.sink)
+        mirror(df_valid)
+        self.assertRaises(ColumnNullError, mirror, pd.DataFrame({'a': [1, None]}))
+        self.assertRaises(DFEmptyError, mirror, None)
+        self.assertEqual([(validator, 2, type(None)), (validator, 2, ColumnNullError), (validator, 0, DFEmptyError)],
+                         self.sink.events)
+        self.assertEqual(3, validator.stats.calls)
+        self.assertEqual({'ColumnNullError': 1, 'DFEmptyError': 1}, dict(validator.stats.failures))
+        unregister_sink(self.sink)
+        mirror(df_valid)
+        self.assertEqual(3, validator.stats.calls)
+
+    def test_stream(self):
+        register_sink(self.sink)
+
+        @ColumnNotNull({'a': 'all'})
+        def generate():
+            yield pd.DataFrame({'a': [1]})
+            yield pd.DataFrame({'a': [1, 2]})
+
+        list(generate())
+        self.assertEqual([1, 2], [n_rows for _, n_rows, _ in self.sink.events])
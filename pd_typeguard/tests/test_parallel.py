@@ -0,0 +1,61 @@
+from unittest import TestCase
+from ..parallel import map_ordered, set_default_workers, get_default_workers
+from ..decorators import ColumnNotNull, ColumnUnique, ColumnSingleValue
+from ..schema import Schema
+from ..exceptions import ColumnNotUniqueError, ColumnNotSingleValueError, ColumnNullError
+
+import threading
+import pandas as pd
+
+
+class TestMapOrdered(TestCase):
+
+    def tearDown(self):
+        set_default_workers(None)
+
+    def test_order(self):
+        self.assertEqual([x * 2 for x in range(50)], map_ordered(lambda x: x * 2, range(50), workers=4))
+        self.assertEqual([], map_ordered(lambda x: x, [], workers=4))
+
+    def test_threads(self):
+        thread_ids = set()
+
+        def record(_):
+            thread_ids.add(threading.get_ident())
+
+        map_ordered(record, range(10))
+        self.assertEqual({threading.get_ident()}, thread_ids)
+        set_default_workers(2)
+        self.assertEqual(2, get_default_workers())
+        map_ordered(record, range(10))
+        self.assertGreater(len(thread_ids), 1)
+        self.assertRaises(ValueError, set_default_workers, 0)
+
+    def test_first_error(self):
+
+        def fail(x):
+            if x in (3, 7):
+                raise ValueError(x)
+            return x
+
+        with self.assertRaises(ValueError) as context:
+            map_ordered(fail, range(10), workers=4)
+        self.assertEqual((3,), context.exception.args)
+
+
+class TestParallelValidation(TestCase):
+
+    def test_validate(self):
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': [1, 1, 1], 'c': [1., None, 3.], 'd': ['x', 'y', 'y']})
+        self.assertIs(df, ColumnUnique(['a', 'c'], keys=[('a', 'b')], workers=4).validate(df))
+        self.assertIs(df, ColumnSingleValue(['b'], workers=4).validate(df))
+        self.assertIs(df, ColumnNotNull({'a': 'all', 'c': 'any'}, workers=4).validate(df))
+        with self.assertRaises(ColumnNotUniqueError) as context:
+            ColumnUnique(['a', 'b', 'd'], workers=4).validate(df)
+        self.assertIn('Column b', str(context.exception))
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['b', 'a'], workers=4).validate, df)
+        self.assertRaises(ColumnNullError, ColumnNotNull({'c': 'all'}, workers=4).validate, df)
+        schema = Schema(notnull={'a': 'all'}, unique=['a'], single_value=['b'], keys=[('b', 'd')], workers=4)
+        self.assertRaises(ColumnNotUniqueError, schema.validate, df)
+        self.assertIs(df, Schema(unique=['a', 'c'], keys=[('a', 'd')], workers=4).validate(df))
+        self.assertRaises(ValueError, ColumnUnique, ['a'], workers=0)
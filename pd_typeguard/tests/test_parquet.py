@@ -0,0 +1,107 @@
+from unittest import TestCase, mock, skipIf
+import os
+import tempfile
+from ..decorators import HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue
+from ..schema import Schema
+from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError,
+                          ColumnNotSingleValueError)
+from .. import arrow, parquet
+
+import numpy as np
+
+pa = arrow.pa
+ds = parquet.ds
+
+
+@skipIf(pa is None, 'pyarrow is not installed')
+class TestParquet(TestCase):
+
+    def setUp(self):
+        import pyarrow.parquet as pq
+        self.write_table = pq.write_table
+        self.directory = tempfile.TemporaryDirectory()
+        self.table = pa.table({'a': [1, 2, 3, 4], 'b': [1., None, None, 2.], 'c': ['x', 'x', None, 'x'],
+                               'd': [1, 1, 2, 2]})
+        self.path = self.write(self.table, 'data.parquet', row_group_size=2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, table, name, **kwargs):
+        path = os.path.join(self.directory.name, name)
+        self.write_table(table, path, **kwargs)
+        return path
+
+    def assert_no_data_read(self):
+        return mock.patch.object(parquet, '_read_row_group', side_effect=AssertionError('data read'))
+
+    def test_metadata(self):
+        """ Columns, dtypes, nulls and single values are validated from the footer. """
+        with self.assert_no_data_read():
+            self.assertEqual(self.path, HasColumn(['a', 'b']).validate_parquet(self.path))
+            self.assertRaises(MissingColumnError, HasColumn(['e']).validate_parquet, self.path)
+            ColumnHasDtype({'a': pa.int64(), 'c': pa.string()}).validate_parquet(self.path)
+            self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': pa.float64()}).validate_parquet, self.path)
+            ColumnHasDtype({'a': 'int64', 'b': np.float64, 'c': object}).validate_parquet(self.path)
+            Schema(dtypes={'a': 'int64', 'c': pa.string()}).validate_parquet(self.path)
+            self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': 'float64'}).validate_parquet, self.path)
+            ColumnNotNull({'a': 'all', 'b': 'any'}).validate_parquet(self.path)
+            with self.assertRaises(ColumnNullError) as context:
+                ColumnNotNull({'b': 'all', 'c': 'all'}).validate_parquet(self.path)
+            self.assertEqual({'b': 2, 'c': 1}, context.exception.null_counts)
+            ColumnSingleValue(['c']).validate_parquet(self.path)
+            with self.assertRaises(ColumnNotSingleValueError) as context:
+                Schema(single_value=['d']).validate_parquet(self.path)
+            self.assertEqual((1, 2), context.exception.values)
+            self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['b']).validate_parquet, self.path)
+
+    def test_missing_statistics(self):
+        """ Column chunks without statistics are read. """
+        path = self.write(self.table, 'no_statistics.parquet', row_group_size=2, write_statistics=['a'])
+        ColumnNotNull({'a': 'all', 'b': 'any'}).validate_parquet(path)
+        self.assertRaises(ColumnNullError, Schema(notnull={'c': 'all'}).validate_parquet, path)
+        ColumnSingleValue(['c']).validate_parquet(path)
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['d']).validate_parquet, path)
+        with mock.patch.object(parquet, '_read_row_group', side_effect=parquet._read_row_group) as read:
+            ColumnNotNull({'a': 'all', 'c': 'any'}).validate_parquet(path)
+        self.assertEqual(2, read.call_count)
+        self.assertEqual(['c'], read.call_args[0][2])
+
+    def test_dataset(self):
+        directory = os.path.join(self.directory.name, 'dataset')
+        os.mkdir(directory)
+        self.write(self.table.slice(0, 2), os.path.join('dataset', 'part-0.parquet'))
+        self.write(self.table.slice(2), os.path.join('dataset', 'part-1.parquet'))
+        with self.assert_no_data_read():
+            Schema(notnull={'a': 'all'}, single_value=['c']).validate_parquet(directory)
+            self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['d']).validate_parquet, directory)
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique(['d']).validate_parquet, directory)
+        Schema(unique=['a'], keys=[('b', 'd')]).validate_parquet(directory)
+
+    def test_partitioned(self):
+        """ Hive partition columns are answered from the paths of the files. """
+        import pyarrow.parquet as pq
+        directory = os.path.join(self.directory.name, 'partitioned')
+        pq.write_to_dataset(self.table.append_column('p', pa.array(['x', 'x', 'y', None])), directory,
+                            partition_cols=['p'])
+        with self.assert_no_data_read():
+            HasColumn(['p']).validate_parquet(directory)
+            self.assertRaises(ColumnNullError, ColumnNotNull({'p': 'all'}).validate_parquet, directory)
+            ColumnNotNull({'p': 'any'}).validate_parquet(directory)
+            self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['p']).validate_parquet, directory)
+            dataset = ds.dataset(os.path.join(directory, 'p=x'), format='parquet')
+            ColumnSingleValue(['c']).validate_parquet(dataset)
+        with self.assertRaises(ColumnNullError) as context:
+            ColumnNotNull({'p': 'all'}).validate_parquet(directory)
+        self.assertEqual({'p': 1}, context.exception.null_counts)
+
+    def test_empty(self):
+        path = self.write(self.table.slice(0, 0), 'empty.parquet')
+        self.assertRaises(DFEmptyError, HasColumn(['a']).validate_parquet, path)
+        HasColumn(['a'], allow_empty=True).validate_parquet(path)
+
+    def test_report(self):
+        report = Schema(notnull={'b': 'all'}, unique=['d'], single_value=['d']).validate_parquet(self.path,
+                                                                                                 mode='report')
+        self.assertEqual([ColumnNullError, ColumnNotSingleValueError, ColumnNotUniqueError],
+                         [type(error) for error in report])
@@ -0,0 +1,104 @@
+from unittest import TestCase, mock, skipIf
+from ..decorators import (NotEmpty, HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue)
+from ..schema import Schema
+from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError,
+                          ColumnNotSingleValueError)
+from .. import arrow, polars_backend
+
+import numpy as np
+
+pa = arrow.pa
+pl = polars_backend.pl
+
+
+@skipIf(pl is None, 'polars is not installed')
+class TestPolars(TestCase):
+
+    def setUp(self):
+        self.df = pl.DataFrame({'a': [1, 2, 3], 'b': [1., None, None], 'c': ['x', 'x', None], 'd': ['x', 'y', 'x']})
+
+    def test_frame(self):
+        self.assertIs(self.df, NotEmpty().validate(self.df))
+        self.assertEqual(3, NotEmpty().validate(self.df.lazy()).collect().height)
+        self.assertRaises(DFEmptyError, NotEmpty().validate(self.df.lazy().head(0)).collect)
+        self.assertRaises(DFEmptyError, NotEmpty()(lambda: self.df.lazy().filter(pl.col('a') > 3))().collect)
+        self.assertIs(self.df, HasColumn(['a', 'b']).validate(self.df))
+        self.assertRaises(MissingColumnError, HasColumn(['e']).validate, self.df)
+        self.assertRaises(DFEmptyError, HasColumn(['a']).validate, self.df.head(0))
+        self.assertIs(self.df, HasColumn(['a'], allow_empty=True).validate(self.df))
+
+    def test_single_select(self):
+        """ All content checks of a validator are evaluated in one select. """
+        validator = Schema(notnull={'a': 'all', 'b': 'any'}, unique=['a'], single_value=['c'], keys=[('c', 'd')])
+        with mock.patch.object(pl.DataFrame, 'select', autospec=True, side_effect=pl.DataFrame.select) as select:
+            validator.validate(self.df)
+        self.assertEqual(1, select.call_count)
+        self.assertEqual(5, len(select.call_args[0][1]))
+
+    def test_dtype(self):
+        ColumnHasDtype({'a': pl.Int64, 'c': pl.String}).validate(self.df)
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': pl.Int32}).validate, self.df)
+        self.assertRaises(WrongDtypeError, Schema(dtypes={'a': pl.Float64}).validate, self.df)
+        ColumnHasDtype({'a': 'int64', 'c': object}).validate(self.df)
+        Schema(dtypes={'a': np.int64}).validate(self.df)
+        ColumnHasDtype({'a': 'Int64'}).validate(self.df)
+        ColumnHasDtype({'a': pa.int64(), 'c': pa.large_string()}).validate(self.df)
+        ColumnHasDtype({'c': 'category'}).validate(self.df.with_columns(pl.col('c').cast(pl.Categorical)))
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': 'int32'}).validate, self.df)
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': 'float64'}).validate, self.df.lazy())
+
+    def test_not_null(self):
+        ColumnNotNull({'a': 'all', 'b': 'any'}).validate(self.df)
+        with self.assertRaises(ColumnNullError) as context:
+            ColumnNotNull({'b': 'all', 'c': 'all'}).validate(self.df)
+        self.assertEqual({'b': 2, 'c': 1}, context.exception.null_counts)
+        self.assertEqual({'b': [1, 2], 'c': [2]}, context.exception.positions)
+        self.assertRaises(ColumnNullError, Schema(notnull={'b': 'any'}).validate, self.df.slice(1))
+
+    def test_unique(self):
+        ColumnUnique(['a'], keys=[('c', 'd')]).validate(self.df)
+        Schema(unique=['a'], keys=[('c', 'd')]).validate(self.df)
+        with self.assertRaises(ColumnNotUniqueError) as context:
+            ColumnUnique(['d']).validate(self.df)
+        self.assertEqual([2], context.exception.positions)
+        self.assertEqual(['x'], context.exception.values)
+        self.assertRaises(ColumnNotUniqueError, ColumnUnique(['b']).validate, self.df)
+        with self.assertRaises(ColumnNotUniqueError) as context:
+            Schema(keys=[('a', 'd')]).validate(pl.DataFrame({'a': [1, 1], 'd': ['x', 'x']}))
+        self.assertEqual([(1, 'x')], context.exception.values)
+
+    def test_single_value(self):
+        ColumnSingleValue(['c']).validate(self.df)
+        ColumnSingleValue(['b']).validate(self.df)
+        with self.assertRaises(ColumnNotSingleValueError) as context:
+            Schema(single_value=['d']).validate(self.df)
+        self.assertEqual(('x', 'y'), context.exception.values)
+        self.assertEqual([1], context.exception.positions)
+
+    def test_lazy(self):
+        """ Content checks run when the LazyFrame is collected, the schema is validated right away. """
+        lazy = self.df.lazy()
+        validated = ColumnUnique(['d']).validate(lazy)
+        self.assertIsInstance(validated, pl.LazyFrame)
+        self.assertRaises(ColumnNotUniqueError, validated.collect)
+        self.assertRaises(ColumnNotUniqueError, validated.filter(pl.col('a') < 2).collect)
+        self.assertEqual(3, Schema(unique=['a'], notnull={'b': 'any'}).validate(lazy).collect().height)
+        self.assertRaises(MissingColumnError, HasColumn(['e']).validate, lazy)
+        self.assertRaises(WrongDtypeError, ColumnHasDtype({'a': pl.Int32}).validate, lazy)
+
+    def test_decorator(self):
+        @ColumnNotNull({'b': 'all'})
+        def lazy_frame():
+            return self.df.lazy().with_columns(pl.col('b').fill_null(0.))
+
+        self.assertEqual([1., 0., 0.], lazy_frame().collect()['b'].to_list())
+
+    def test_report(self):
+        report = Schema(notnull={'b': 'all'}, unique=['d']).validate(self.df, mode='report')
+        self.assertEqual([ColumnNullError, ColumnNotUniqueError], [type(error) for error in report])
+
+    def test_stream(self):
+        validator = Schema(unique=['a'], single_value=['c'], notnull={'b': 'any'})
+        chunks = [self.df.slice(i, 1) for i in range(3)]
+        self.assertEqual(3, len(list(validator.validate_stream(iter(chunks)))))
+        self.assertRaises(ColumnNotUniqueError, list, validator.validate_stream(iter(chunks + chunks)))
@@ -0,0 +1,51 @@
+from unittest import TestCase, mock
+import io
+from ..decorators import HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique
+from ..schema import Schema
+from ..readers import read_csv
+from ..exceptions import DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError
+
+import pandas as pd
+
+CSV = 'a,b,c\n' + ''.join('%i,%i,x\n' % (i, i % 2) for i in range(10))
+
+
+class TestReadCsv(TestCase):
+
+    def test_read(self):
+        df = read_csv(io.StringIO(CSV), Schema(dtypes={'a': 'int64'}, notnull={'b': 'all'}, unique=['a']),
+                      chunksize=3)
+        pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(CSV)), df)
+        chunks = read_csv(io.StringIO(CSV), HasColumn(['a']), chunksize=4, iterator=True)
+        self.assertEqual([4, 4, 2], [len(chunk) for chunk in chunks])
+        self.assertEqual(['a'], list(read_csv(io.StringIO(CSV), HasColumn(['a']), usecols=['a']).columns))
+
+    def test_header_first(self):
+        """ Missing columns are found before any data is parsed. """
+        with mock.patch.object(pd.io.parsers.readers.TextFileReader, 'get_chunk',
+                               side_effect=AssertionError('data parsed')):
+            self.assertRaises(MissingColumnError, read_csv, io.StringIO(CSV), HasColumn(['d']))
+
+    def test_early_abort(self):
+        """ Parsing stops at the first violating chunk. """
+        csv = CSV + 'x,,x\n' + ''.join('%i,%i,x\n' % (i, i % 2) for i in range(100))
+        with mock.patch.object(pd.io.parsers.readers.TextFileReader, 'get_chunk', autospec=True,
+                               side_effect=pd.io.parsers.readers.TextFileReader.get_chunk) as get_chunk:
+            self.assertRaises(WrongDtypeError, read_csv, io.StringIO(csv), ColumnHasDtype({'a': 'int64'}),
+                              chunksize=5)
+        self.assertEqual(3, get_chunk.call_count)
+        self.assertRaises(ColumnNullError, read_csv, io.StringIO(csv), ColumnNotNull({'b': 'all'}), chunksize=5)
+        self.assertRaises(ColumnNotUniqueError, read_csv, io.StringIO(csv), ColumnUnique(['c']), chunksize=5)
+
+    def test_empty(self):
+        self.assertRaises(DFEmptyError, read_csv, io.StringIO('a,b\n'), HasColumn(['a']))
+        self.assertEqual(['a', 'b'], list(read_csv(io.StringIO('a,b\n'), HasColumn(['a'], allow_empty=True)).columns))
+
+    def test_not_seekable(self):
+        buffer = mock.Mock(wraps=io.StringIO(CSV), spec=['read', '__iter__'])
+        with self.assertRaises(ValueError) as context:
+            read_csv(buffer, HasColumn(['a']))
+        self.assertIn('seekable', str(context.exception))
+        buffer = io.StringIO(CSV)
+        buffer.seekable = lambda: False
+        self.assertRaises(ValueError, read_csv, buffer, HasColumn(['a']))
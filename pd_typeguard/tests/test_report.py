@@ -0,0 +1,56 @@
+from unittest import TestCase
+from ..decorators import NotEmpty, HasColumn, ColumnHasDtype, ColumnNotNull, ColumnUnique, ColumnSingleValue
+from ..schema import Schema
+from ..report import ValidationReport
+from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError, ColumnNotUniqueError,
+                          ColumnNotSingleValueError, ValidationReportError)
+
+import pandas as pd
+
+
+class TestValidationReport(TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({'a': [1, 1, 1], 'b': [1., None, None], 'c': ['x', 'y', 'x'], 'd': [1, 2, 3]})
+
+    def test_report(self):
+        report = ValidationReport(NotEmpty(), [])
+        self.assertTrue(report.ok)
+        report.raise_if_failed()
+        report = ValidationReport(NotEmpty(), [DFEmptyError('empty')])
+        self.assertFalse(report.ok)
+        self.assertEqual(1, len(report))
+        self.assertIn('DFEmptyError: empty', str(report))
+        with self.assertRaises(ValidationReportError) as context:
+            report.raise_if_failed()
+        self.assertIs(report, context.exception.report)
+
+    def test_mode(self):
+        self.assertRaises(ValueError, NotEmpty().validate, [1], mode='collect')
+        self.assertRaises(ValueError, HasColumn(['a']).validate, self.df, mode='collect')
+        self.assertTrue(NotEmpty().validate([1], mode='report').ok)
+        self.assertEqual([DFEmptyError], [type(e) for e in NotEmpty().validate([], mode='report')])
+        self.assertEqual([DFEmptyError], [type(e) for e in HasColumn(['a']).validate(None, mode='report')])
+        self.assertEqual([MissingColumnError], [type(e) for e in ColumnUnique(['x']).validate(self.df, mode='report')])
+        report = ColumnHasDtype({'a': 'float64'}).validate(self.df.head(0), mode='report')
+        self.assertEqual([DFEmptyError, WrongDtypeError], [type(e) for e in report])
+
+    def test_all_violations(self):
+        report = ColumnUnique(['a', 'b', 'd'], keys=[('a', 'c')]).validate(self.df, mode='report')
+        self.assertEqual(3, len(report))
+        self.assertIn('Column a is not unique! 2 duplicate rows', str(report.errors[0]))
+        self.assertIn('Column b is not unique! 1 duplicate rows', str(report.errors[1]))
+        self.assertIn('Columns (a, c) are not unique! 1 duplicate rows', str(report.errors[2]))
+        report = ColumnSingleValue(['a', 'c', 'd']).validate(self.df, mode='report')
+        self.assertEqual([ColumnNotSingleValueError] * 2, [type(e) for e in report])
+        report = ColumnNotNull({'b': 'all', 'a': 'all'}).validate(self.df, mode='report')
+        self.assertEqual([ColumnNullError], [type(e) for e in report])
+
+    def test_schema(self):
+        schema = Schema(dtypes={'a': 'float64'}, notnull={'b': 'all'}, unique=['a', 'c'], single_value=['d'],
+                        keys=[('a', 'd')], workers=2)
+        report = schema.validate(self.df, mode='report')
+        self.assertEqual([WrongDtypeError, ColumnNullError, ColumnNotUniqueError, ColumnNotUniqueError,
+                          ColumnNotSingleValueError], [type(e) for e in report])
+        self.assertRaises(WrongDtypeError, schema.validate, self.df)
+        self.assertTrue(Schema(unique=['d']).validate(self.df, mode='report').ok)
@@ -0,0 +1,62 @@
+from unittest import TestCase, mock
+from ..sampling import Sample
+from ..decorators import ColumnNotNull, ColumnUnique, ColumnSingleValue, HasColumn
+from ..schema import Schema
+from ..exceptions import ColumnNullError, ColumnNotSingleValueError, MissingColumnError
+
+import numpy as np
+import pandas as pd
+
+
+class TestSample(TestCase):
+
+    def test_spec(self):
+        self.assertRaises(ValueError, Sample)
+        self.assertRaises(ValueError, Sample, fraction=0.1, n=10)
+        self.assertRaises(ValueError, Sample, fraction=1.5)
+        self.assertRaises(TypeError, Sample.from_spec, 'all')
+        self.assertEqual(Sample.from_spec(0.5).fraction, 0.5)
+        self.assertEqual(Sample.from_spec(10).n, 10)
+        self.assertIsNone(Sample.from_spec(None))
+
+    def test_positions(self):
+        self.assertEqual(Sample(n=10).size(5), 5)
+        self.assertEqual(Sample(fraction=0.01).size(10), 1)
+        positions = Sample(n=100, random_state=1).positions(1000)
+        self.assertEqual(len(np.unique(positions)), 100)
+        self.assertTrue((np.diff(positions) > 0).all())
+        np.testing.assert_array_equal(positions, Sample(n=100, random_state=1).positions(1000))
+        positions = Sample(n=100, chunks=10, random_state=1).positions(1000)
+        self.assertEqual(len(np.unique(positions)), 100)
+        np.testing.assert_array_equal(np.bincount(positions // 100), [10] * 10)
+
+    def test_draw(self):
+        df = pd.DataFrame({'a': range(100)})
+        self.assertIs(df, Sample(fraction=1.).draw(df))
+        self.assertEqual(len(Sample(n=10).draw(df)), 10)
+        self.assertEqual(len(df), 100)
+
+    def test_guarantee(self):
+        guarantee = Sample(n=1000).guarantee(10 ** 6)
+        self.assertEqual(guarantee.n_sampled, 1000)
+        self.assertAlmostEqual(guarantee.min_violation_rate, 0.003, places=3)
+        self.assertIn('1000 of 1000000 rows', str(guarantee))
+        self.assertEqual(Sample(n=1000).guarantee(10).min_violation_rate, 0.)
+
+
+class TestSampledValidation(TestCase):
+
+    def test_validate(self):
+        df = pd.DataFrame({'a': [None] * 99 + [1.], 'b': [1.] * 50 + [2.] * 50, 'c': range(100)})
+        self.assertIs(df, ColumnNotNull({'a': 'any'}, sample=10).validate(df))
+        self.assertIs(df, Schema(notnull={'a': 'any'}, sample=Sample(n=10, random_state=0)).validate(df))
+        self.assertRaises(ColumnNullError, ColumnNotNull({'a': 'all'}, sample=50).validate, df)
+        self.assertRaises(ColumnNotSingleValueError, ColumnSingleValue(['b'], sample=Sample(n=20, chunks=2)).validate,
+                          df)
+        self.assertIs(df, ColumnUnique(['c'], sample=0.5).validate(df))
+        schema = Schema(notnull={'c': 'any'}, single_value=['b'], sample=Sample(n=20, chunks=2))
+        with mock.patch.object(Schema, '_validate_details', autospec=True,
+                               side_effect=Schema._validate_details) as validate_details:
+            self.assertRaises(ColumnNotSingleValueError, schema.validate, df)
+        self.assertEqual(1, validate_details.call_count)
+        self.assertRaises(MissingColumnError, HasColumn(['d'], sample=10).validate, df)
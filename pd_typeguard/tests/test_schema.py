@@ -0,0 +1,83 @@
+from unittest import TestCase, mock
+from .. import schema as schema_module
+from ..schema import Schema
+from ..exceptions import (DFEmptyError, MissingColumnError, WrongDtypeError, ColumnNullError,
+                          ColumnNotUniqueError, ColumnNotSingleValueError)
+
+import pickle
+import pandas as pd
+
+
+class TestSchema(TestCase):
+
+    def test_validate_default(self):
+        validate = Schema().validate
+        self.assertRaises(DFEmptyError, validate, None)
+        validate = Schema(allow_none=True).validate
+        self.assertIsNone(validate(None))
+        self.assertRaises(ValueError, Schema, notnull={'a': 'some'})
+        self.assertIsNone(Schema({}, {}, [], [], True).validate(None))
+
+    def test_validate_simple(self):
+        df_valid = pd.DataFrame({'a': [1, 2], 'b': ['x', 'x'], 'c': [None, 1.]})
+        validate = Schema(dtypes={'a': 'int64'}, notnull={'a': 'all', 'c': 'any'},
+                          unique=['a'], single_value=['b']).validate
+        self.assertIs(df_valid, validate(df_valid))
+        self.assertRaises(MissingColumnError, validate, df_valid[['a', 'b']])
+        self.assertRaises(DFEmptyError, validate, df_valid.head(0))
+        self.assertRaises(WrongDtypeError, validate, df_valid.astype({'a': 'float64'}))
+        self.assertRaises(ColumnNullError, Schema(notnull={'c': 'all'}).validate, df_valid)
+        self.assertRaises(ColumnNullError, Schema(notnull={'c': 'any'}).validate, df_valid.head(1))
+        self.assertRaises(ColumnNotUniqueError, Schema(unique=['b']).validate, df_valid)
+        self.assertRaises(ColumnNotSingleValueError, Schema(single_value=['a']).validate, df_valid)
+        self.assertIs(df_valid, Schema(keys=[('a', 'b')]).validate(df_valid))
+        self.assertRaises(ColumnNotUniqueError, Schema(keys=[('b', 'c')]).validate, df_valid.iloc[[1, 1]])
+
+    def test_allow_empty(self):
+        df_empty = pd.DataFrame({'a': pd.Series([], dtype='int64')})
+        validate = Schema(dtypes={'a': 'int64'}, notnull={'a': 'any'}, allow_empty=True).validate
+        self.assertIs(df_empty, validate(df_empty))
+        validate = Schema(dtypes={'a': 'float64'}, allow_empty=True).validate
+        self.assertRaises(WrongDtypeError, validate, df_empty)
+
+    def test_decorator(self):
+
+        @Schema(dtypes={'a': 'int64'}, unique=['a'])
+        def mirror(value):
+            return value
+
+        self.assertIsNotNone(mirror(pd.DataFrame({'a': [1, 2]})))
+        self.assertRaises(ColumnNotUniqueError, mirror, pd.DataFrame({'a': [1, 1]}))
+
+    def test_validate_stream(self):
+        schema = Schema(dtypes={'a': 'float64'}, notnull={'a': 'any'}, unique=['b'], single_value=['c'],
+                        keys=[('a', 'b')])
+        df_1 = pd.DataFrame({'a': [float('nan')] * 2, 'b': [1, 2], 'c': ['x', 'x']})
+        df_2 = pd.DataFrame({'a': [1., None], 'b': [3, 4], 'c': ['x', 'x']})
+        self.assertEqual(2, len(list(schema.validate_stream(iter([df_1, df_2])))))
+        self.assertRaises(ColumnNullError, list, schema.validate_stream(iter([df_1])))
+        self.assertRaises(ColumnNotUniqueError, list, schema.validate_stream(iter([df_2, df_2])))
+        self.assertRaises(ColumnNotSingleValueError, list, schema.validate_stream(
+            iter([df_1, df_2.assign(c='y')])))
+
+    def test_check_order(self):
+        """ Cheap checks run first, checks that fail often move to the front. """
+        df = pd.DataFrame({'a': [1, 1], 'b': [None, 1.]})
+        schema = Schema(notnull={'a': 'all', 'b': 'all'}, unique=['a'])
+        self.assertRaises(ColumnNullError, schema.validate, df)
+        schema = Schema(single_value=['b'], notnull={'a': 'all'})
+        df = pd.DataFrame({'a': [None, 1.], 'b': [1, 2]})
+        self.assertRaises(ColumnNullError, schema.validate, df)
+        with mock.patch.object(schema_module.time, 'perf_counter', return_value=0.):  # no timing noise
+            for _ in range(20):
+                self.assertRaises(ColumnNotSingleValueError, schema.validate, df.fillna(0))
+        self.assertRaises(ColumnNotSingleValueError, schema.validate, df)
+        report = schema.validate(df, mode='report')
+        self.assertEqual([ColumnNullError, ColumnNotSingleValueError], [type(error) for error in report])
+
+    def test_pickle(self):
+        schema = Schema(notnull={'a': 'all'}, unique=['a'])
+        schema.validate(pd.DataFrame({'a': [1, 2]}))
+        copied = pickle.loads(pickle.dumps(schema))
+        self.assertEqual(schema._profile._stats, copied._profile._stats)
+        self.assertRaises(ColumnNotUniqueError, copied.validate, pd.DataFrame({'a': [1, 1]}))